@@ -0,0 +1,94 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from JobSeekerProfile.models import JobseekerProfile
+from Jobs.models import Jobs
+from Application.models import Application
+from Application.utils import apply_to_job, ApplyError
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire N parallel applications at one job with max_applicants=M and "
+        "check the job takes exactly min(M, N) of them, without errors. "
+        "Creates its own throwaway employer, job and jobseekers and deletes "
+        "them afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applicants", type=int, default=50)
+        parser.add_argument("--max", type=int, default=10, dest="max_applicants")
+        parser.add_argument("--threads", type=int, default=16)
+
+    def handle(self, *args, **options):
+        applicants = options["applicants"]
+        max_applicants = options["max_applicants"]
+        tag = uuid.uuid4().hex[:8]
+
+        employer_user = CustomUser.objects.create_user(email=f"bench-employer-{tag}@example.com")
+        try:
+            employer = EmployerProfile.objects.create(
+                user=employer_user, first_name="Bench", last_name="Employer",
+                business_name=f"Bench {tag}", city="Sittwe",
+            )
+            job = Jobs.objects.create(
+                employer=employer, title=f"Bench job {tag}", description="benchmark",
+                max_applicants=max_applicants,
+            )
+            profiles = []
+            for i in range(applicants):
+                user = CustomUser.objects.create_user(email=f"bench-seeker-{tag}-{i}@example.com")
+                profiles.append(JobseekerProfile.objects.create(user=user, full_name=f"Seeker {i}"))
+
+            def apply(profile):
+                started = time.perf_counter()
+                try:
+                    apply_to_job(profile, job)
+                    result = "accepted"
+                except ApplyError:
+                    result = "rejected"
+                except Exception as e:  # e.g. "database is locked"
+                    result = f"error: {e.__class__.__name__}"
+                finally:
+                    connections.close_all()
+                return result, time.perf_counter() - started
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+                results = list(pool.map(apply, profiles))
+            elapsed = time.perf_counter() - started
+
+            job.refresh_from_db()
+            stored = job.applications_count
+            actual = Application.objects.filter(job=job).count()
+            accepted = sum(1 for result, _ in results if result == "accepted")
+            rejected = sum(1 for result, _ in results if result == "rejected")
+            errors = [result for result, _ in results if result.startswith("error")]
+            latencies = sorted(duration for _, duration in results)
+
+            self.stdout.write(f"backend:           {connection.vendor}")
+            self.stdout.write(f"applicants:        {applicants} on {options['threads']} threads")
+            self.stdout.write(f"max_applicants:    {max_applicants}")
+            self.stdout.write(f"accepted/rejected: {accepted}/{rejected}, errors: {len(errors)}")
+            self.stdout.write(f"stored counter:    {stored}, actual rows: {actual}, job active: {job.is_active}")
+            self.stdout.write(
+                f"wall time:         {elapsed * 1000:.1f} ms, "
+                f"p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+                f"max {latencies[-1] * 1000:.1f} ms"
+            )
+            if max_applicants and actual > max_applicants or stored != actual or accepted != actual:
+                raise CommandError("Capacity overshoot or counter mismatch detected.")
+            if errors:
+                raise CommandError(f"{len(errors)} apply(s) failed with an error: {', '.join(sorted(set(errors)))}")
+            expected = min(max_applicants, applicants) if max_applicants else applicants
+            if accepted < expected and job.is_active:
+                raise CommandError(
+                    f"Only {accepted} of {expected} slots were filled and the job is still open."
+                )
+            self.stdout.write(self.style.SUCCESS("No overshoot, every free slot filled."))
+        finally:
+            CustomUser.objects.filter(email__contains=f"-{tag}").delete()
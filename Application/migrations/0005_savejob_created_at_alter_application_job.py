@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Application', '0004_alter_application_job'),
+        ('Jobs', '0013_jobs_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savejob',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='Jobs.jobs'),
+        ),
+    ]
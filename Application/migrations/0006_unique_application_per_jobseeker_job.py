@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:37
+
+from django.db import migrations, models
+
+
+def check_duplicate_applications(apps, schema_editor):
+    # 0003 dropped this constraint, so duplicates may exist. Which of them
+    # to keep is a data decision: list them and stop instead of deleting.
+    Application = apps.get_model("Application", "Application")
+    rows = (
+        Application.objects.using(schema_editor.connection.alias)
+        .filter(job_seeker_profile__isnull=False)
+        .order_by("job_id", "job_seeker_profile_id", "applied_at", "id")
+        .values_list("job_id", "job_seeker_profile_id", "id", "status")
+    )
+    pairs = {}
+    for job_id, profile_id, app_id, status in rows.iterator():
+        pairs.setdefault((job_id, profile_id), []).append(f"{app_id} ({status})")
+    duplicates = {pair: ids for pair, ids in pairs.items() if len(ids) > 1}
+    if not duplicates:
+        return
+    lines = [
+        f"  job {job_id}, profile {profile_id}: {', '.join(ids)}"
+        for (job_id, profile_id), ids in duplicates.items()
+    ]
+    raise RuntimeError(
+        f"{len(duplicates)} (job, jobseeker) pair(s) have more than one application, "
+        f"so unique_application_per_jobseeker_job can't be added. Delete the extra "
+        f"rows (application id (status), oldest first), run "
+        f"`manage.py reconcile_application_counts`, then migrate again:\n" + "\n".join(lines)
+    )
+
+
+def allow_duplicates_again(apps, schema_editor):
+    # the forward step only checks, it never changes rows: once the
+    # constraint is removed (reversed first) there is nothing to restore
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Application', '0005_savejob_created_at_alter_application_job'),
+        ('JobSeekerProfile', '0006_merge_20251023_0952'),
+        ('Jobs', '0014_jobs_application_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_applications, allow_duplicates_again),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('job', 'job_seeker_profile'), name='unique_application_per_jobseeker_job'),
+        ),
+    ]
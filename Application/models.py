@@ -1,7 +1,7 @@
 from django.db import models
 from JobSeekerProfile.models import JobseekerProfile,Resume
 from Jobs.models import Jobs
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.core.exceptions import ValidationError
 import uuid
 
@@ -13,6 +13,7 @@ class SaveJob(models.Model):
     )
     profile = models.ForeignKey(JobseekerProfile, on_delete=models.CASCADE,related_name='saved_jobs', null=True, blank=True)
     job = models.ForeignKey(Jobs, on_delete=models.CASCADE, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
 
     class Meta:
         constraints = [
@@ -46,6 +47,14 @@ class ApplicationManager(models.Manager):
     
     def recent_applications(self,limit=2):
         return self.get_queryset().order_by('-applied_at')[:limit]
+
+    def status_counts(self, queryset=None):
+        # {"total": n, "P": n, "H": n, ...} in one conditional aggregate
+        queryset = self.get_queryset() if queryset is None else queryset
+        return queryset.aggregate(
+            total=Count("id"),
+            **{code: Count("id", filter=Q(status=code)) for code, label in self.model.STATUS_CHOICES},
+        )
     
 class Application(models.Model):
     STATUS_CHOICES = [
@@ -70,6 +79,14 @@ class Application(models.Model):
 
     objects = ApplicationManager()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "job_seeker_profile"],
+                name="unique_application_per_jobseeker_job"
+            )
+        ]
+
     def __str__(self):
         return f"{self.job_seeker_profile} applied for {self.job}"
         
@@ -3,7 +3,8 @@ import json
 from uuid import UUID
 from datetime import date, datetime
 from .models import *
-from Jobs.serializers import JobsSerializer
+from Jobs.serializers import JobsSerializer, JobListSerializer
+from JobSeeker.fieldsets import SparseFieldsMixin
 from Application.models import Resume
 from JobSeekerProfile.models import Education, Experience, Skill, Language
 
@@ -13,8 +14,14 @@ class ResumeSerializer(serializers.ModelSerializer):
         model = Resume
         fields = "__all__"
 
-class ApplicationListSerializer(serializers.ModelSerializer):
-    job = JobsSerializer(read_only=True)
+class ApplicationListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    FIELD_SOURCES = {
+        "status_display": ("status",),
+        "jobseeker_name": ("job_seeker_profile__full_name",),
+        "jobseeker_email": ("job_seeker_profile__user__email",),
+    }
+
+    job = JobListSerializer(read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
     jobseeker_name = serializers.CharField(source="job_seeker_profile.full_name", read_only=True)
     jobseeker_email = serializers.CharField(source="job_seeker_profile.user.email", read_only=True)
@@ -32,8 +39,14 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
         model = Application
         fields = "__all__"
 
-class SaveJobsSerializer(serializers.ModelSerializer):
-    job=JobsSerializer(read_only=True)
+class SaveJobsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    FIELD_SOURCES = {
+        "job_id": ("job",),
+        "is_applied": ("job",),
+    }
+
+    # list card: description_excerpt, no full description
+    job=JobListSerializer(read_only=True)
     job_id=serializers.UUIDField(write_only=True)
     is_applied = serializers.SerializerMethodField()
     class Meta:
@@ -41,6 +54,10 @@ class SaveJobsSerializer(serializers.ModelSerializer):
         fields='__all__'
 
     def get_is_applied(self, obj):
+        # list views pass the applied job ids of the whole page (saved_jobs)
+        applied_job_ids = self.context.get("applied_job_ids")
+        if applied_job_ids is not None:
+            return obj.job_id in applied_job_ids
         user_profile = obj.profile
         if not user_profile:
             return False
@@ -50,6 +67,9 @@ class SaveJobsSerializer(serializers.ModelSerializer):
             job_seeker_profile=user_profile
         ).exists()
 
+class SaveJobDetailSerializer(SaveJobsSerializer):
+    job=JobsSerializer(read_only=True)
+
 class ApplicationCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
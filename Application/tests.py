@@ -1,3 +1,262 @@
+import uuid
+from datetime import timedelta
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from JobSeekerProfile.models import JobseekerProfile
+from Jobs.counters import COUNT_FIELDS, reconcile_application_counts
+from Jobs.models import Jobs, JobCategory
+from Notification.models import Notification
+from Application.models import Application, SaveJob
+from Application.utils import ApplyError, apply_to_job, bulk_update_status
 
-# Create your tests here.
+STATUSES = [code for code, label in Application.STATUS_CHOICES]
+
+
+class ApplicationListQueryCountTests(TestCase):
+    """
+    The application list endpoints load every relation their serializers
+    read in the same query, so they run the same number of queries for one
+    row per status and for many (no per-row lazy loads).
+    """
+    # (url name, who calls it, query params, queries)
+    ENDPOINTS = [
+        ("employer-applications", "employer", {}, 2),
+        ("employer-pending-applicatons", "employer", {}, 1),
+        ("employer-reviewed-applicatons", "employer", {}, 1),
+        ("employer-rejected-applicatons", "employer", {}, 1),
+        ("employer-shortlist-applicatons", "employer", {}, 1),
+        ("employer-hired-applicatons", "employer", {}, 1),
+        ("recent-applications", "employer", {}, 1),
+        ("apply-jobs-list", "seeker", {}, 1),
+        ("apply-jobs-list", "seeker", {"fields": "id,job.title"}, 1),
+        ("employer-applications", "employer", {"omit": "job"}, 2),
+        ("saved-job-list", "seeker", {}, 3),
+        ("saved-job-list", "seeker", {"fields": "id,is_applied,job.title"}, 3),
+        ("employer-application-pipeline", "employer", {}, 3),
+        ("employer-application-pipeline", "employer", {"status": "P,shortlist"}, 3),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer_user = CustomUser.objects.create_user(email="employer@example.com", role="employer")
+        cls.employer = EmployerProfile.objects.create(
+            user=cls.employer_user, first_name="Query", last_name="Check",
+            business_name="Queries Co", city="Sittwe",
+        )
+        cls.seeker_user = CustomUser.objects.create_user(email="seeker@example.com", role="jobseeker")
+        cls.seeker = JobseekerProfile.objects.create(user=cls.seeker_user, full_name="Query Seeker")
+        cls.category = JobCategory.objects.create(name="Queries")
+        cls.add_applications(1)
+
+    @classmethod
+    def add_applications(cls, per_status):
+        for status in STATUSES:
+            for i in range(per_status):
+                job = Jobs.objects.create(
+                    employer=cls.employer, category=cls.category if i % 2 else None,
+                    title=f"Query job {status} {i}", description="check",
+                )
+                Application.objects.create(job=job, job_seeker_profile=cls.seeker, status=status)
+                SaveJob.objects.create(profile=cls.seeker, job=job)
+
+    def assert_query_counts(self):
+        callers = {"employer": self.employer_user, "seeker": self.seeker_user}
+        for name, who, params, queries in self.ENDPOINTS:
+            with self.subTest(endpoint=name, params=params):
+                client = APIClient()
+                client.force_authenticate(callers[who])
+                with self.assertNumQueries(queries):
+                    response = client.get(reverse(name), {"page_size": 100, **params})
+                self.assertEqual(response.status_code, 200, response.data)
+
+    def test_one_row_per_status(self):
+        self.assert_query_counts()
+
+    def test_many_rows_per_status(self):
+        self.add_applications(9)
+        self.assert_query_counts()
+
+
+class ApplicationTestData:
+    """One employer and a few jobseekers; jobs are created per test."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(
+            user=CustomUser.objects.create_user(email="counters@example.com", role="employer"),
+            first_name="Count", last_name="Check", business_name="Counters Co", city="Sittwe",
+        )
+        cls.seekers = [
+            JobseekerProfile.objects.create(
+                user=CustomUser.objects.create_user(email=f"applicant{i}@example.com", role="jobseeker"),
+                full_name=f"Applicant {i}",
+            )
+            for i in range(4)
+        ]
+
+    def create_job(self, **kwargs):
+        return Jobs.objects.create(employer=self.employer, title="Counted job", description="check", **kwargs)
+
+    def assert_counts(self, job, **expected):
+        job.refresh_from_db()
+        self.assertEqual(
+            {field: getattr(job, field) for field in COUNT_FIELDS},
+            {field: expected.get(field, 0) for field in COUNT_FIELDS},
+        )
+
+
+class ApplicationCounterTests(ApplicationTestData, TestCase):
+    """The stored counters on Jobs follow application creates, status changes and deletes."""
+
+    def test_create_change_delete(self):
+        job = self.create_job()
+        first = Application.objects.create(job=job, job_seeker_profile=self.seekers[0])
+        Application.objects.create(job=job, job_seeker_profile=self.seekers[1], status="R")
+        self.assert_counts(job, applications_count=2, pending_count=1, review_count=1)
+
+        first.status = "R"
+        first.save()
+        self.assert_counts(job, applications_count=2, review_count=2)
+
+        first.delete()
+        self.assert_counts(job, applications_count=1, review_count=1)
+
+    def test_reconcile_repairs_drift(self):
+        job = self.create_job()
+        Application.objects.create(job=job, job_seeker_profile=self.seekers[0])
+        Application.objects.create(job=job, job_seeker_profile=self.seekers[1])
+        # queryset update()/delete() bypass the signals
+        Application.objects.filter(job_seeker_profile=self.seekers[0]).update(status="SL")
+        Jobs.objects.filter(pk=job.pk).update(applications_count=7, hired_count=3)
+
+        checked, drifted = reconcile_application_counts(fix=False)
+        self.assertEqual(checked, 1)
+        self.assertEqual(drifted, [(job.pk, {
+            "applications_count": (7, 2), "hired_count": (3, 0),
+            "pending_count": (2, 1), "shortlist_count": (0, 1),
+        })])
+        self.assert_counts(job, applications_count=7, hired_count=3, pending_count=2)
+
+        reconcile_application_counts()
+        self.assert_counts(job, applications_count=2, pending_count=1, shortlist_count=1)
+        self.assertEqual(reconcile_application_counts(fix=False), (1, []))
+
+
+class ApplyToJobTests(ApplicationTestData, TestCase):
+    """apply_to_job reserves a slot on the stored counter and says why it refused one."""
+
+    def test_reserves_and_closes_when_full(self):
+        job = self.create_job(max_applicants=2)
+        apply_to_job(self.seekers[0], job)
+        self.assert_counts(job, applications_count=1, pending_count=1)
+        self.assertTrue(job.is_active)
+
+        apply_to_job(self.seekers[1], job)
+        self.assert_counts(job, applications_count=2, pending_count=2)
+        self.assertFalse(job.is_active)
+
+        with self.assertRaisesMessage(ApplyError, "maximum number of applicants"):
+            apply_to_job(self.seekers[2], job)
+        self.assert_counts(job, applications_count=2, pending_count=2)
+
+    def test_duplicate(self):
+        job = self.create_job(max_applicants=5)
+        apply_to_job(self.seekers[0], job)
+        with self.assertRaisesMessage(ApplyError, "already applied"):
+            apply_to_job(self.seekers[0], job)
+        # the slot reserved for the duplicate was rolled back
+        self.assert_counts(job, applications_count=1, pending_count=1)
+        self.assertEqual(Application.objects.filter(job=job).count(), 1)
+
+    def test_duplicate_on_full_job(self):
+        job = self.create_job(max_applicants=1)
+        apply_to_job(self.seekers[0], job)
+        with self.assertRaisesMessage(ApplyError, "already applied"):
+            apply_to_job(self.seekers[0], job)
+
+    def test_closed_or_expired(self):
+        for kwargs in ({"is_active": False}, {"deadline": timezone.localdate() - timedelta(days=1)}):
+            with self.subTest(**kwargs):
+                job = self.create_job(**kwargs)
+                with self.assertRaisesMessage(ApplyError, "no longer accepting applications"):
+                    apply_to_job(self.seekers[0], job)
+                self.assert_counts(job)
+                self.assertFalse(Application.objects.filter(job=job).exists())
+
+
+class BulkUpdateStatusTests(ApplicationTestData, TestCase):
+    """bulk_update_status validates every item, then writes the valid ones in bulk."""
+
+    def setUp(self):
+        self.job = self.create_job()
+        self.apps = [
+            Application.objects.create(job=self.job, job_seeker_profile=seeker, status=status)
+            for seeker, status in zip(self.seekers, ["P", "R", "SL", "H"])
+        ]
+
+    def test_results_counters_and_notifications(self):
+        pending, review, shortlist, hired = self.apps
+        other_employer = EmployerProfile.objects.create(
+            user=CustomUser.objects.create_user(email="other@example.com", role="employer"),
+            first_name="Other", last_name="Employer", business_name="Other Co", city="Sittwe",
+        )
+        foreign = Application.objects.create(
+            job=Jobs.objects.create(employer=other_employer, title="Not yours", description="check"),
+            job_seeker_profile=self.seekers[0],
+        )
+        missing = uuid.uuid4()
+
+        results = bulk_update_status(self.employer, [
+            (pending.id, "review"),      # P -> R
+            (review.id, "SL"),           # R -> SL
+            (pending.id, "rejected"),    # listed twice
+            (shortlist.id, "pending"),   # no going back
+            (hired.id, "RJ"),            # hired is final
+            (review.id, "nonsense"),     # listed twice (checked before the status)
+            (missing, "R"),
+            (foreign.id, "R"),           # another employer's application
+            ("not-a-uuid", "R"),
+        ])
+
+        self.assertEqual([(r["success"], r.get("new_status")) for r in results], [
+            (True, "R"), (True, "SL"), (False, None), (False, None), (False, None),
+            (False, None), (False, None), (False, None), (False, None),
+        ])
+        self.assertEqual(results[2]["error"], "Application listed more than once.")
+        self.assertEqual(results[3]["allowed_next"], ["H", "RJ"])
+        self.assertEqual(results[4]["allowed_next"], [])
+        self.assertEqual(results[5]["error"], "Application listed more than once.")
+        for result in results[6:]:
+            self.assertEqual(result["error"], "Application not found.")
+        self.assertEqual(results[8]["id"], "not-a-uuid")
+
+        self.assertEqual(
+            dict(Application.objects.filter(job=self.job).values_list("job_seeker_profile", "status")),
+            {self.seekers[0].pk: "R", self.seekers[1].pk: "SL", self.seekers[2].pk: "SL", self.seekers[3].pk: "H"},
+        )
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, "P")
+        # P -1, R +1 -1, SL +1
+        self.assert_counts(self.job, applications_count=4, review_count=1, shortlist_count=2, hired_count=1)
+        self.assertEqual(reconcile_application_counts(fix=False)[1], [])
+
+        notifications = Notification.objects.filter(type="application_update").order_by("message")
+        self.assertEqual(
+            [(n.user_id, n.object_id) for n in notifications],
+            [(self.seekers[0].user_id, pending.id), (self.seekers[1].user_id, review.id)],
+        )
+        self.assertIn("'ShortList'", notifications[1].message)
+
+    def test_one_query_per_step(self):
+        # savepoint, select_for_update, bulk_update, one counter update per job,
+        # content type, bulk_create, release: however many items
+        ContentType.objects.clear_cache()
+        items = [(self.apps[0].id, "R"), (self.apps[1].id, "SL"), (self.apps[2].id, "H")]
+        with self.assertNumQueries(7):
+            results = bulk_update_status(self.employer, items)
+        self.assertTrue(all(result["success"] for result in results))
@@ -17,8 +17,10 @@ urlpatterns = [
     path("employer/application/rejected/",rejected_applications,name="employer-rejected-applicatons"),
     path("employer/application/shortlist/",shortlist_applications,name="employer-shortlist-applicatons"),
     path("employer/application/hired/",hired_applications,name="employer-hired-applicatons"),
+    path("employer/application/pipeline/",application_pipeline,name="employer-application-pipeline"),
 
     path("applications/<uuid:app_id>/update-status/", update_application_status, name="application-update-status"),
+    path("applications/bulk-update-status/", bulk_update_application_status, name="application-bulk-update-status"),
     path("applications/recent/",recent_applications,name="recent-applications"),
     
     #save jobs
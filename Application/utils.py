@@ -0,0 +1,283 @@
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+from Jobs.counters import bump_counters, counter_changes
+from Jobs.models import Jobs
+from Jobs import autocomplete, fuzzy, viewer, cache as search_cache
+from Notification.models import Notification
+from .models import Application
+
+logger = logging.getLogger(__name__)
+
+# human -> status code
+STATUS_MAP = {
+    "pending": "P",
+    "review": "R",
+    "shortlist": "SL",
+    "rejected": "RJ",
+    "hired": "H",
+}
+
+# Allowed workflow transitions (no going back)
+ALLOWED_STATUS_FLOW = {
+    "P":  ["R"],
+    "R":  ["SL", "RJ"],
+    "SL": ["H", "RJ"],
+    "H":  [],
+    "RJ": []
+}
+
+
+class ApplyError(Exception):
+    """Raised by apply_to_job with a message safe to show to the jobseeker."""
+
+
+def apply_to_job(profile, job, status="P", cover_letter_text=""):
+    """
+    Create an application without overshooting job.max_applicants.
+
+    A slot is reserved with one conditional UPDATE on the job's stored
+    counter (active, not expired, and below the limit), the application is
+    inserted in the same transaction (the unique (job, jobseeker)
+    constraint catches duplicates), and the job is closed once it is full.
+    The transaction only writes: no read comes before the UPDATE, which on
+    SQLite would fail with "database is locked" instead of waiting. Why an
+    apply was refused is looked up afterwards, outside the transaction.
+    """
+    application = _reserve_and_insert(profile, job, status or "P", cover_letter_text)
+    if application is None:
+        _reject(profile, job)
+    return application
+
+
+@transaction.atomic
+def _reserve_and_insert(profile, job, status, cover_letter_text):
+    """The new application, None when no slot could be reserved (nothing written)."""
+    today = timezone.localdate()
+    reserved = (
+        Jobs.objects
+        .filter(pk=job.pk, is_active=True)
+        .filter(Q(deadline__isnull=True) | Q(deadline__gte=today))
+        .filter(Q(max_applicants=0) | Q(applications_count__lt=F("max_applicants")))
+        .update(**counter_changes(1, {status: 1}))
+    )
+    if not reserved:
+        return None
+
+    application = Application(
+        job_seeker_profile=profile,
+        job=job,
+        status=status,
+        cover_letter_text=cover_letter_text,
+    )
+    application._counters_reserved = True  # counters already bumped above
+    try:
+        application.save(force_insert=True)
+    except IntegrityError:
+        # raising out of the atomic block rolls back the slot reserved above
+        raise ApplyError("You have already applied for this job.")
+
+    # close the job in the same transaction when this was the last slot
+    closed = Jobs.objects.filter(
+        pk=job.pk,
+        is_active=True,
+        max_applicants__gt=0,
+        applications_count__gte=F("max_applicants"),
+    ).update(is_active=False)
+    if closed:
+        transaction.on_commit(search_cache.bump_version)
+        transaction.on_commit(lambda: autocomplete.job_removed(job.pk))
+        transaction.on_commit(lambda: fuzzy.job_removed(job.pk))
+    return application
+
+
+def _reject(profile, job):
+    # re-applying to a job that has filled up since is "already applied"
+    if Application.objects.filter(job=job, job_seeker_profile=profile).exists():
+        raise ApplyError("You have already applied for this job.")
+    job.refresh_from_db(fields=["is_active", "deadline", "max_applicants", "applications_count"])
+    if job.max_applicants and job.applications_count >= job.max_applicants:
+        raise ApplyError("The maximum number of applicants for this job has been reached.")
+    raise ApplyError("This job is no longer accepting applications.")
+
+
+def status_code(value):
+    """'rejected' / 'RJ' -> 'RJ', None when it is no status."""
+    code = STATUS_MAP.get(str(value).lower(), value)
+    return code if code in dict(Application.STATUS_CHOICES) else None
+
+
+def transition_error(app, new_status):
+    """Why `app` can't move to `new_status` (a response dict), None if it can."""
+    allowed = ALLOWED_STATUS_FLOW.get(app.status, [])
+    if new_status in allowed:
+        return None
+    return {
+        "error": f"Cannot move application from '{app.get_status_display()}' "
+                 f"to '{dict(Application.STATUS_CHOICES).get(new_status)}'.",
+        "allowed_next": allowed,
+    }
+
+
+def status_notification(app):
+    """Unsaved in-app notification for the jobseeker of `app` (new status set)."""
+    return Notification(
+        user=app.job_seeker_profile.user,
+        message=(
+            f"Your application for '{app.job.title}' has been updated to "
+            f"'{app.get_status_display()}'."
+        ),
+        type="application_update",
+        content_type=ContentType.objects.get_for_model(app),
+        object_id=app.id,
+    )
+
+
+def status_email(app, connection=None):
+    """The status update email (text + HTML) for `app`, None without a recipient."""
+    jobseeker = app.job_seeker_profile.user
+    recipient = jobseeker.email
+    if not recipient:
+        return None
+
+    status_label = app.get_status_display()
+    status_class = STATUS_MAP.get(status_label, "pending")
+    job_title = app.job.title
+    username = app.job_seeker_profile.full_name or jobseeker.email.split("@")[0]
+
+    frontend_url = getattr(settings, "FRONTEND_URL", "http://127.0.0.1:8000")
+    application_link = f"{frontend_url}/job-search/applications/{app.id}"
+
+    subject = f"Your application status updated to '{status_label}' for {job_title}"
+
+    # Plain-text version
+    text_content = (
+        f"Hello {username},\n\n"
+        f"Your application for the position '{job_title}' has been updated.\n"
+        f"New status: {status_label}\n\n"
+        f"View your application here:\n{application_link}\n\n"
+        f"Thank you for using Arakkha Job Connect."
+    )
+
+    # Render HTML from template file
+    html_content = render_to_string(
+        "emails/application_status_update.html",
+        {
+            "username": username,
+            "job_title": job_title,
+            "status_label": status_label,
+            "status_class": status_class,
+            "application_link": application_link,
+            "year": datetime.now().year,
+        },
+    )
+
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@arakkha-job-connect.com"),
+        to=[recipient],
+        connection=connection,
+    )
+    email.attach_alternative(html_content, "text/html")
+    return email
+
+
+def send_status_emails(apps):
+    """Render and send the status emails of `apps` over one SMTP connection."""
+    try:
+        connection = get_connection(fail_silently=True)
+        emails = [email for email in (status_email(app, connection) for app in apps) if email]
+        if emails:
+            connection.send_messages(emails)
+    except Exception:
+        logger.exception("Sending %d application status email(s) failed", len(apps))
+
+
+def queue_status_emails(apps):
+    """Send the emails in a background thread once the transaction commits."""
+    if not apps:
+        return
+    transaction.on_commit(
+        lambda: threading.Thread(target=send_status_emails, args=(list(apps),), daemon=True).start()
+    )
+
+
+def _uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def bulk_update_status(employer, items):
+    """
+    Apply [(application id, new status), ...] for `employer` in one
+    transaction: every item is validated against ALLOWED_STATUS_FLOW, the
+    valid ones are written with one bulk_update, the job counters are
+    adjusted per job, notifications go in with one bulk_create and the
+    emails are sent in the background after commit.
+    Returns one result dict per item, in order.
+    """
+    results = []
+    with transaction.atomic():
+        ids = {_uuid(app_id) for app_id, new_status in items} - {None}
+        apps = {
+            app.id: app
+            for app in Application.objects
+            .select_for_update(of=("self",))
+            .select_related("job", "job_seeker_profile__user")
+            .filter(id__in=ids, job__employer=employer)
+        }
+
+        changed, seen = [], set()
+        deltas = defaultdict(lambda: defaultdict(int))  # job id -> status -> +/-
+        now = timezone.now()
+        for raw_id, new_status in items:
+            result = {"id": str(raw_id)}
+            results.append(result)
+            app_id = _uuid(raw_id)
+            app = apps.get(app_id)
+            if app is None:
+                result.update(success=False, error="Application not found.")
+                continue
+            if app_id in seen:
+                result.update(success=False, error="Application listed more than once.")
+                continue
+            seen.add(app_id)
+            code = status_code(new_status)
+            if code is None:
+                result.update(success=False, error="Invalid status value.")
+                continue
+            error = transition_error(app, code)
+            if error:
+                result.update(success=False, **error)
+                continue
+
+            deltas[app.job_id][app.status] -= 1
+            deltas[app.job_id][code] += 1
+            app.status = code
+            app.updated_at = now  # bulk_update skips auto_now
+            changed.append(app)
+            result.update(success=True, new_status=code)
+
+        if changed:
+            # bulk_update bypasses the post_save signals: counters, viewer flags
+            Application.objects.bulk_update(changed, ["status", "updated_at"])
+            for job_id, statuses in deltas.items():
+                bump_counters(job_id, 0, statuses)
+            notify = [app for app in changed if app.job_seeker_profile is not None]
+            Notification.objects.bulk_create([status_notification(app) for app in notify])
+            user_ids = {app.job_seeker_profile.user_id for app in notify}
+            transaction.on_commit(lambda: viewer.invalidate_users(user_ids))
+            queue_status_emails(notify)
+    return results
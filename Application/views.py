@@ -1,15 +1,12 @@
 # applications/views.py
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.core.mail import EmailMultiAlternatives
 from django.conf import settings
 from rest_framework.decorators import api_view, permission_classes, parser_classes
 from rest_framework.permissions import IsAuthenticated,AllowAny
 from rest_framework.response import Response
-import datetime
 from rest_framework import status
 from django.shortcuts import get_object_or_404  # see below
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError
 from .models import Jobs,JobseekerProfile
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from .models import *
@@ -17,6 +14,15 @@ from Application.models import *
 from Notification.models import *
 from Jobs.models import *
 from .serializers import *
+from .utils import (
+    apply_to_job, ApplyError, bulk_update_status, status_code, status_email,
+    status_notification, transition_error,
+)
+from JobSeeker.pagination import paginate, default_page_size
+from JobSeeker.fieldsets import requested_fields
+from Jobs.query import QueryError, choice_codes, resolve_codes
+from rest_framework.exceptions import ValidationError
+import uuid
 #hello wrold
 
 @api_view(["POST"])
@@ -26,67 +32,29 @@ def apply_job(request, job_id):
     #Get job seeker profile & job
     profile = get_object_or_404(JobseekerProfile, user=request.user)
     job = get_object_or_404(Jobs, id=job_id)
-    print(job.id)
-    print("Max applicants:", job.max_applicants, type(job.max_applicants))
-    
-    # Duplicate application check
-    if Application.objects.filter(job=job, job_seeker_profile=profile).exists():
-        return Response(
-            {"message": "You have already applied for this job."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
-    #Max applicants null-safe check
-    max_limit = getattr(job, "max_applicants", None)
-    total = Application.objects.filter(job=job).count()
-
-    # Treat 0 or None as unlimited
-    if max_limit is None or max_limit <= 0:
-        max_limit = None
-
-    if max_limit is not None and total >= max_limit:
-        if job.is_active:
-            job.is_active = False
-            job.save(update_fields=["is_active"])
-        
-        return Response(
-        {"message": "The maximum number of applicants for this job has been reached."},
-        status=status.HTTP_400_BAD_REQUEST
-    )
-
-    
 
     #Serialize incoming data
     serializer = ApplicationCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-    #Create application inside a transaction
-    try:
-        with transaction.atomic():
-            application = Application.objects.create(
-                job_seeker_profile=profile,
-                job=job,
-                status=serializer.validated_data.get("status", "P"),
-                cover_letter_text=serializer.validated_data.get("cover_letter_text", "")
-            )
-
-            #Re-count AFTER creating; close job if hitting limit
-            total_after = Application.objects.filter(job=job).count()
-            if max_limit is not None and total_after >= max_limit and job.is_active:
-                job.is_active = False
-                job.save(update_fields=["is_active"])
-
-            s_application = ApplicationDetailSerializer(application).data
-            return Response({
-                "success": True,
-                "message": f"You have successfully applied for the job '{job.title}'.",
-                "data": s_application
-            }, status=status.HTTP_201_CREATED)
 
-    except IntegrityError:
-        return Response(
-            {"message": "You have already applied for this job."},
-            status=status.HTTP_400_BAD_REQUEST
+    # Reserve a slot + create the application in one transaction
+    # (duplicates are caught by the unique constraint, see utils.apply_to_job)
+    try:
+        application = apply_to_job(
+            profile,
+            job,
+            status=serializer.validated_data.get("status", "P"),
+            cover_letter_text=serializer.validated_data.get("cover_letter_text", ""),
         )
+    except ApplyError as e:
+        return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    s_application = ApplicationDetailSerializer(application).data
+    return Response({
+        "success": True,
+        "message": f"You have successfully applied for the job '{job.title}'.",
+        "data": s_application
+    }, status=status.HTTP_201_CREATED)
 
 
 @api_view(['POST'])
@@ -121,9 +89,19 @@ def saved_jobs(request):
     except JobseekerProfile.DoesNotExist:
         return Response({"detail": "Ah! You have to create profile before save job"}, status=status.HTTP_404_NOT_FOUND)
     
-    savejobs=SaveJob.objects.filter(profile=profile)
-    s_savejobs=SaveJobsSerializer(savejobs,many=True).data
-    return Response({"s_savejobs":s_savejobs})
+    # ?fields= / ?omit=, and the job, employer and category rows in the same query
+    selection=requested_fields(request,SaveJobsSerializer)
+    savejobs=SaveJobsSerializer.setup_eager_loading(SaveJob.objects.filter(profile=profile),selection)
+    savejobs,next_cursor=paginate(request,savejobs,("-created_at","-id"))
+    # "already applied" for the whole page in one query
+    applied_job_ids=set(
+        Application.objects.filter(
+            job_seeker_profile=profile,
+            job_id__in=[saved.job_id for saved in savejobs],
+        ).values_list("job_id",flat=True)
+    )
+    s_savejobs=SaveJobsSerializer(savejobs,many=True,selection=selection,context={"applied_job_ids":applied_job_ids}).data
+    return Response({"s_savejobs":s_savejobs,"next_cursor":next_cursor})
 
     
 @api_view(['GET'])
@@ -137,7 +115,7 @@ def saved_job_detail(request,sj_id):
         saved_job=SaveJob.objects.get(profile=profile,id=sj_id)
     except SaveJob.DoesNotExist:
         return Response({"detail": "This job is not saved."}, status=status.HTTP_404_NOT_FOUND)
-    s_saved_job=SaveJobsSerializer(saved_job).data
+    s_saved_job=SaveJobDetailSerializer(saved_job).data
     return Response({"saved_job":s_saved_job})
 
 @api_view(['DELETE'])
@@ -157,11 +135,21 @@ def saved_job_remove(request,sj_id):
     else:
         return Response({"Message":"Something Wrong Please try again"})
 
+def _sparse_applications(request, queryset):
+    # ?fields= / ?omit= narrow the query as well as the payload, and the job,
+    # employer, category, profile and user rows come in the same query
+    # (JobSeeker/fieldsets.py, Application/tests.py)
+    selection = requested_fields(request, ApplicationListSerializer)
+    return ApplicationListSerializer.setup_eager_loading(queryset, selection), selection
+
+
 @api_view(['GET'])
 def applied_jobs(request):
     applications = Application.objects.filter(job_seeker_profile__user=request.user)
-    app_job=ApplicationListSerializer(applications,many=True).data
-    return Response({"apply_jobs": app_job})
+    applications, selection = _sparse_applications(request, applications)
+    applications, next_cursor = paginate(request, applications, ("-applied_at", "-id"))
+    app_job=ApplicationListSerializer(applications,many=True,selection=selection).data
+    return Response({"apply_jobs": app_job, "next_cursor": next_cursor})
 
 @api_view(['GET'])
 def applied_job_detail(request,app_id):
@@ -184,8 +172,10 @@ def applied_job_remove(request,app_id):
 def applications(request):
     employer=get_object_or_404(EmployerProfile,user=request.user)
     query=Application.objects.applications_for_employer(employer)
-    applications=ApplicationListSerializer(query,many=True).data
-    return Response({"applications":applications})
+    query,selection=_sparse_applications(request,query)
+    query,next_cursor=paginate(request,query,("-applied_at","-id"))
+    applications=ApplicationListSerializer(query,many=True,selection=selection).data
+    return Response({"applications":applications,"next_cursor":next_cursor})
 
 
 @api_view(["GET"])
@@ -209,8 +199,8 @@ def application_delete(request,app_id):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def pending_applications(request):
-    apps = Application.objects.submitted_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
+    apps, selection = _sparse_applications(request, Application.objects.submitted_applications(request.user))
+    s_apps=ApplicationListSerializer(apps,many=True,selection=selection).data
     return Response({
         "pending_apps":s_apps,
         "count": len(s_apps)
@@ -220,8 +210,8 @@ def pending_applications(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def reviewed_applications(request):
-    apps = Application.objects.reviewed_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
+    apps, selection = _sparse_applications(request, Application.objects.reviewed_applications(request.user))
+    s_apps=ApplicationListSerializer(apps,many=True,selection=selection).data
     return Response({
         "reviewed_apps":s_apps,
         "count": len(s_apps)
@@ -231,8 +221,8 @@ def reviewed_applications(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def rejected_applications(request):
-    apps = Application.objects.rejected_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
+    apps, selection = _sparse_applications(request, Application.objects.rejected_applications(request.user))
+    s_apps=ApplicationListSerializer(apps,many=True,selection=selection).data
     return Response({
         "rejected_apps":s_apps,
         "count": len(s_apps)
@@ -241,8 +231,8 @@ def rejected_applications(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def shortlist_applications(request):
-    apps = Application.objects.shortlist_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
+    apps, selection = _sparse_applications(request, Application.objects.shortlist_applications(request.user))
+    s_apps=ApplicationListSerializer(apps,many=True,selection=selection).data
     return Response({
         "shorlist_apps":s_apps,
         "count": len(s_apps)
@@ -251,8 +241,8 @@ def shortlist_applications(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def hired_applications(request):
-    apps = Application.objects.hired_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
+    apps, selection = _sparse_applications(request, Application.objects.hired_applications(request.user))
+    s_apps=ApplicationListSerializer(apps,many=True,selection=selection).data
     return Response({
         "hired_apps":s_apps,
         "count": len(s_apps)
@@ -260,6 +250,40 @@ def hired_applications(request):
 
 
 
+STATUS_CODES = choice_codes(Application.STATUS_CHOICES)
+
+
+# employer pipeline: a page of applications + the count of every status
+#   ?status=P,SL (codes or labels)  ?job=<uuid>  ?cursor=  ?page_size=  ?fields= / ?omit=
+# (replaces calling the five per-status endpoints above)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def application_pipeline(request):
+    employer=get_object_or_404(EmployerProfile,user=request.user)
+    apps=Application.objects.applications_for_employer(employer)
+    if request.GET.get("job"):
+        try:
+            apps=apps.filter(job_id=uuid.UUID(request.GET["job"]))
+        except ValueError:
+            raise ValidationError({"job": "Must be a job id."})
+
+    # counts ignore ?status so every pipeline column stays filled
+    counts=Application.objects.status_counts(apps)
+
+    if request.GET.get("status"):
+        try:
+            apps=apps.filter(status__in=resolve_codes(request.GET["status"],STATUS_CODES,"status"))
+        except QueryError as e:
+            raise ValidationError({"status": str(e)})
+    apps,selection=_sparse_applications(request,apps)
+    apps,next_cursor=paginate(request,apps,("-applied_at","-id"),page_size=default_page_size())
+    return Response({
+        "applications":ApplicationListSerializer(apps,many=True,selection=selection).data,
+        "counts":counts,
+        "next_cursor":next_cursor,
+    })
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def update_application_status(request, app_id):
@@ -277,127 +301,96 @@ def update_application_status(request, app_id):
     # Get application
     app = get_object_or_404(Application, id=app_id, job__employer=employer)
 
-    # Extract status
-    new_status = request.data.get("new_status", "")
-
-    # Map human → codes
-    STATUS_MAP = {
-        "pending": "P",
-        "review": "R",
-        "shortlist": "SL",
-        "rejected": "RJ",
-        "hired": "H",
-    }
-    new_status = STATUS_MAP.get(str(new_status).lower(), new_status)
+    # Extract status, human or code ("rejected" / "RJ")
+    new_status = status_code(request.data.get("new_status", ""))
 
     # Validate
     valid_statuses = [choice[0] for choice in Application.STATUS_CHOICES]
-    if new_status not in valid_statuses:
+    if new_status is None:
         return Response(
             {"error": "Invalid status value.", "valid_statuses": valid_statuses},
             status=status.HTTP_400_BAD_REQUEST,
         )
     
-    # Allowed workflow transitions
-    ALLOWED_STATUS_FLOW = {
-        "P":  ["R"],
-        "R":  ["SL", "RJ"],
-        "SL": ["H", "RJ"],
-        "H":  [],
-        "RJ": []
-    }
-
-    current_status = app.status
-
-    #  Prevent backward or invalid transitions
-    if new_status not in ALLOWED_STATUS_FLOW[current_status]:
-        return Response(
-            {
-                "error": f"Cannot move application from '{app.get_status_display()}' "
-                         f"to '{dict(Application.STATUS_CHOICES).get(new_status)}'.",
-                "allowed_next": ALLOWED_STATUS_FLOW[current_status]
-            },
-            status=status.HTTP_400_BAD_REQUEST
-        )
+    # Prevent backward or invalid transitions (ALLOWED_STATUS_FLOW in utils)
+    error = transition_error(app, new_status)
+    if error:
+        return Response(error, status=status.HTTP_400_BAD_REQUEST)
 
     # Update
     app.status = new_status
     app.save()
 
     # Create in-app notification
-    Notification.objects.create(
-        user=app.job_seeker_profile.user,
-        message=(
-            f"Your application for '{app.job.title}' has been updated to "
-            f"'{app.get_status_display()}'."
-        ),
-        type="application_update",
-        content_type=ContentType.objects.get_for_model(app),
-        object_id=app.id,
-    )
+    status_notification(app).save()
 
     #SEND EMAIL (ENGLISH ONLY)
+    email = status_email(app)
+    if email:
+        email.send(fail_silently=True)
 
-    jobseeker = app.job_seeker_profile.user
-    recipient = jobseeker.email
-
-    if recipient:
-        status_label = app.get_status_display()
-        status_class = STATUS_MAP.get(status_label, "pending")
-        job_title = app.job.title
-        username = app.job_seeker_profile.full_name or jobseeker.email.split("@")[0]
-
-        frontend_url = getattr(settings, "FRONTEND_URL", "http://127.0.0.1:8000")
-        application_link = f"{frontend_url}/job-search/applications/{app.id}"
-
-
-        subject = f"Your application status updated to '{status_label}' for {job_title}"
-
-        # Plain-text version
-        text_content = (
-            f"Hello {username},\n\n"
-            f"Your application for the position '{job_title}' has been updated.\n"
-            f"New status: {status_label}\n\n"
-            f"View your application here:\n{application_link}\n\n"
-            f"Thank you for using Arakkha Job Connect."
-        )
-
-        # Render HTML from template file
-        html_content = render_to_string(
-        "emails/application_status_update.html",
+    return Response(
         {
-            "username": username,
-            "job_title": job_title,
-            "status_label": status_label,
-            "status_class": status_class, 
-            "application_link": application_link,
-            "year":datetime.now().year,
-            
+            "success": True,
+            "new_status": new_status,
+            "message": f"Application {app.id} updated to '{new_status}'."
         },
+        status=status.HTTP_200_OK,
     )
 
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@arakkha-job-connect.com"),
-            to=[recipient],
+# many applications at once, e.g. rejecting everyone left after a hiring round
+#   {"ids": [...], "new_status": "RJ"}
+#   {"items": [{"id": ..., "new_status": "SL"}, ...]}
+# each item is checked like update_application_status; the valid ones are
+# saved together and their emails are sent in the background
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def bulk_update_application_status(request):
+    employer = getattr(request.user, "employerprofile", None)
+    if not employer:
+        return Response(
+            {"error": "Only employers can perform this action."},
+            status=status.HTTP_403_FORBIDDEN,
         )
-        email.attach_alternative(html_content, "text/html")
-        email.send(fail_silently=True)
 
+    items = _bulk_status_items(request.data)
+    results = bulk_update_status(employer, items)
+    updated = sum(1 for result in results if result["success"])
     return Response(
         {
-            "success": True,
-            "new_status": new_status,
-            "message": f"Application {app.id} updated to '{new_status}'."
+            "success": updated == len(results),
+            "updated": updated,
+            "failed": len(results) - updated,
+            "results": results,
         },
         status=status.HTTP_200_OK,
     )
 
+
+def _bulk_status_items(data):
+    if "items" in data:
+        items = data.get("items")
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValidationError({"items": "Must be a list of {id, new_status} objects."})
+        items = [(item.get("id"), item.get("new_status", "")) for item in items]
+    else:
+        ids = data.get("ids")
+        if not isinstance(ids, list):
+            raise ValidationError({"ids": "Must be a list of application ids."})
+        items = [(app_id, data.get("new_status", "")) for app_id in ids]
+
+    maximum = getattr(settings, "BULK_STATUS_MAX_ITEMS", 500)
+    if not items:
+        raise ValidationError({"items": "Nothing to update."})
+    if len(items) > maximum:
+        raise ValidationError({"items": f"At most {maximum} applications per request."})
+    return items
+
+
 @api_view(['GET'])
 def recent_applications(request):
-    recent_apps=Application.objects.recent_applications()
-    s_recent_apps=ApplicationListSerializer(recent_apps,many=True).data
+    recent_apps,selection=_sparse_applications(request,Application.objects.recent_applications())
+    s_recent_apps=ApplicationListSerializer(recent_apps,many=True,selection=selection).data
     return Response({
         "s_recent_apps":s_recent_apps
     })
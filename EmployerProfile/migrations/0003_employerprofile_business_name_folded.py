@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+from Jobs.migrations._text import backfill_folded_fields
+
+
+def backfill_folded(apps, schema_editor):
+    backfill_folded_fields(
+        apps.get_model("EmployerProfile", "EmployerProfile"),
+        {"business_name": "business_name_folded"},
+        schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EmployerProfile', '0002_employerprofile_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employerprofile',
+            name='business_name_folded',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=510),
+        ),
+        migrations.RunPython(backfill_folded, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from Accounts.models import CustomUser
+from JobSeeker.text import fill_folded_fields
 import uuid
 
 class EmployerProfile(models.Model):
@@ -20,6 +21,8 @@ class EmployerProfile(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     business_name = models.CharField(max_length=255)
+    # fold_text(business_name), kept by save() (JobSeeker/text.py)
+    business_name_folded = models.CharField(max_length=510, blank=True, default="", editable=False, db_index=True)
     city = models.CharField(max_length=100)
     phone = models.CharField(max_length=50, blank=True,null=True)
     #  size = models.CharField(max_length=20, choices=COMPANY_SIZE_CHOICES)
@@ -33,7 +36,12 @@ class EmployerProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True,null=True, blank=True)
 
-    
+    FOLDED_FIELDS = {"business_name": "business_name_folded"}
+
+    def save(self, *args, **kwargs):
+        kwargs["update_fields"] = fill_folded_fields(self, self.FOLDED_FIELDS, kwargs.get("update_fields"))
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.business_name
 
@@ -6,6 +6,9 @@ from django.contrib.auth.hashers import make_password
 from django.shortcuts import redirect
 from django.contrib.auth import get_user_model
 from .utils import send_verification_email
+from JobSeeker.text import fold_text
+from Jobs.listing import card_values, job_cards
+from JobSeeker.fieldsets import requested_fields
 from django.utils.http import urlsafe_base64_decode
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth import login,logout,authenticate
@@ -24,6 +27,7 @@ from Jobs.models import Jobs
 from Application.models import Application
 from .models import EmployerProfile
 from django.db.models import Count
+from JobSeeker.pagination import paginate
 User = get_user_model()
 
 # Pre-register employer (collect email & password)
@@ -287,9 +291,11 @@ def update_employer_profile(request, pk):
 @api_view(['GET'])
 def company_list(request):
     companies_q = EmployerProfile.objects.annotate(job_count=Count("jobs"))
+    companies_q,next_cursor = paginate(request,companies_q,("-created_at","-id"))
     companies_s=CompanySerializer(companies_q,many=True).data
     return Response({
-        "companies":companies_s
+        "companies":companies_s,
+        "next_cursor":next_cursor,
     })
 #end
 
@@ -300,16 +306,18 @@ def jobs_in_company(request,com_id):
     if not company:
         return Response({"error":"Company not found"},status=status.HTTP_404_NOT_FOUND)
     jobs_in_com=Jobs.objects.filter(employer__id=com_id)
-    jobs_in_com_s=JobcompanySerializer(jobs_in_com,many=True).data
+    selection=requested_fields(request,JobListSerializer)
+    jobs_in_com,next_cursor=paginate(request,card_values(jobs_in_com,selection),("-created_at","-id"))
+    jobs_in_com_s=job_cards(jobs_in_com,selection=selection)
     company_s=CompanySerializer(company,many=True).data
-    return Response({"company_s":company_s,"jobs_in_com_s":jobs_in_com_s})
+    return Response({"company_s":company_s,"jobs_in_com_s":jobs_in_com_s,"next_cursor":next_cursor})
 #end
 
 #company serach
 @api_view(['GET'])
 def company_search(request):
     query=request.GET.get('q','')
-    companies=EmployerProfile.objects.filter(business_name__icontains=query)
+    companies=EmployerProfile.objects.filter(business_name_folded__contains=fold_text(query))
     companies_s=CompanySerializer(companies,many=True).data
     return Response({
         "companies":companies_s
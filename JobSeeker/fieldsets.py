@@ -0,0 +1,143 @@
+# JobSeeker/fieldsets.py
+# Sparse fieldsets for the list endpoints:
+#
+#   ?fields=id,title,deadline         only these fields
+#   ?omit=description                 everything but these
+#   ?fields=id,status,job.title       dotted names select inside a nested serializer
+#   ?omit=job.description
+#
+# The selection narrows the queryset too. A serializer lists the model
+# paths each field reads in FIELD_SOURCES, and narrow_queryset() turns the
+# selected ones into only() + select_related(): a column or join that is
+# not rendered is not fetched either.
+#
+#   selection = requested_fields(request, ApplicationListSerializer)
+#   apps = ApplicationListSerializer.setup_eager_loading(apps, selection)
+#   data = ApplicationListSerializer(apps, many=True, selection=selection).data
+#
+# setup_eager_loading() also covers the no-selection case (every field), so
+# a list costs the same number of queries however many rows it has.
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def _names(raw):
+    return [name.strip() for name in (raw or "").split(",") if name.strip()]
+
+
+def _tree(names):
+    # ["job.title", "job.deadline", "id"] -> {"job": ["title", "deadline"], "id": None}
+    # (None = the whole field)
+    tree = {}
+    for name in names:
+        head, _, rest = name.partition(".")
+        if not rest:
+            tree[head] = None
+        elif tree.get(head, []) is not None:
+            tree.setdefault(head, []).append(rest)
+    return tree
+
+
+def _nested(field):
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    return field if isinstance(field, serializers.BaseSerializer) else None
+
+
+def select_fields(serializer, fields=(), omit=(), param="fields"):
+    """
+    {name: sub-selection} for the fields of `serializer` (an instance)
+    kept by `fields` / `omit`. A sub-selection is None for a plain field
+    or a nested serializer rendered whole.
+    """
+    available = serializer.fields
+    include, exclude = _tree(fields), _tree(omit)
+    unknown = [name for name in [*include, *exclude] if name not in available]
+    if unknown:
+        raise ValidationError({param: f"Unknown field(s): {', '.join(unknown)}"})
+
+    selection = {}
+    for name, field in available.items():
+        if include and name not in include:
+            continue
+        if name in exclude and exclude[name] is None:
+            continue
+        sub_fields, sub_omit = include.get(name) or [], exclude.get(name) or []
+        if not (sub_fields or sub_omit):
+            selection[name] = None
+            continue
+        nested = _nested(field)
+        if nested is None:
+            raise ValidationError({param: f"{name} has no sub-fields."})
+        selection[name] = select_fields(nested, sub_fields, sub_omit, param)
+    return selection
+
+
+def requested_fields(request, serializer_class):
+    """The selection asked for by ?fields= / ?omit=, None when neither is given."""
+    fields, omit = _names(request.GET.get("fields")), _names(request.GET.get("omit"))
+    if not (fields or omit):
+        return None
+    if fields and omit:
+        raise ValidationError({"fields": "Use either fields or omit, not both."})
+    return select_fields(serializer_class(), fields, omit, "fields" if fields else "omit")
+
+
+def _sources(serializer, selection, prefix=""):
+    paths = []
+    sources = getattr(serializer, "FIELD_SOURCES", {})
+    for name, sub in selection.items():
+        nested = _nested(serializer.fields[name])
+        if nested is not None:
+            nested_prefix = f"{prefix}{sources.get(name, (name,))[0]}__"
+            paths += _sources(nested, sub or {key: None for key in nested.fields}, nested_prefix)
+        else:
+            paths += [f"{prefix}{path}" for path in sources.get(name, (name,))]
+    return paths
+
+
+def narrow_queryset(queryset, serializer_class, selection):
+    """
+    only() the columns the selected fields read, select_related() the
+    relations they go through. Unchanged when selection is None.
+    """
+    if selection is None:
+        return queryset
+    paths = _sources(serializer_class(), selection)
+    related = {
+        path.rsplit("__", depth)[0]
+        for path in paths
+        for depth in range(1, path.count("__") + 1)
+    }
+    if related:
+        queryset = queryset.select_related(*sorted(related))
+    return queryset.only(*paths)
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin: `selection=` (from requested_fields) drops the fields
+    that were not selected, inside nested serializers too.
+    FIELD_SOURCES maps a field to the model paths it reads, when that is
+    not just its own name.
+    """
+    FIELD_SOURCES = {}
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, selection=None):
+        """Load what the selected (default: all) fields read, in the same query."""
+        if selection is None:
+            selection = select_fields(cls())
+        return narrow_queryset(queryset, cls, selection)
+
+    def __init__(self, *args, selection=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if selection is not None:
+            self.apply_selection(selection)
+
+    def apply_selection(self, selection):
+        for name in list(self.fields):
+            if name not in selection:
+                self.fields.pop(name)
+            elif selection[name] is not None:
+                _nested(self.fields[name]).apply_selection(selection[name])
@@ -0,0 +1,155 @@
+# JobSeeker/pagination.py
+# Keyset (cursor) pagination shared by the list endpoints.
+#
+# A page is "rows after the last row of the previous page" in a fixed
+# ordering that always ends with a unique column (id), so there is no
+# OFFSET scan and rows inserted while a client is paging never shift or
+# duplicate items. The cursor is an opaque base64 string holding the
+# ordering values of the last row.
+#
+#   items, next_cursor = paginate(request, queryset, ("-created_at", "-id"))
+#
+# Query params: ?cursor=<next_cursor>&page_size=<n>
+#
+# Without ?page_size a page holds PAGINATION_MAX_PAGE_SIZE rows, the most a
+# client may ask for: clients written before paging (which never send it)
+# get as much as allowed, and next_cursor when there is more. Endpoints
+# without such clients pass page_size=default_page_size().
+import base64
+import json
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+
+
+def default_page_size():
+    return getattr(settings, "PAGINATION_PAGE_SIZE", 20)
+
+
+def max_page_size():
+    return getattr(settings, "PAGINATION_MAX_PAGE_SIZE", 100)
+
+
+def get_page_size(request, default=None):
+    """?page_size capped at max_page_size(); `default` (the cap if None) when absent."""
+    maximum = max_page_size()
+    raw = request.GET.get("page_size")
+    if not raw:
+        return maximum if default is None else min(default, maximum)
+    try:
+        size = int(raw)
+    except ValueError:
+        raise ValidationError({"page_size": "Must be a whole number."})
+    return max(1, min(size, maximum))
+
+
+def _parse_ordering(model, ordering):
+    fields = []
+    for name in ordering:
+        descending = name.startswith("-")
+        name = name.lstrip("-")
+        fields.append((name, model._meta.get_field(name), descending))
+    return fields
+
+
+def _dump(value):
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()  # keep microseconds, equality matters here
+    return str(value)
+
+
+def encode_cursor(values):
+    raw = json.dumps([_dump(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, fields):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError
+        return [
+            None if value is None else field.to_python(value)
+            for (name, field, descending), value in zip(fields, values)
+        ]
+    except (ValueError, TypeError, DjangoValidationError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+
+def _order_by(fields):
+    # NULLs last when descending, first when ascending: same on every backend
+    return [
+        F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_first=True)
+        for name, field, descending in fields
+    ]
+
+
+def _equal(name, value):
+    if value is None:
+        return Q(**{f"{name}__isnull": True})
+    return Q(**{name: value})
+
+
+def _after(name, field, descending, value):
+    """Rows strictly after `value` in this column, or None if there are none."""
+    if descending:
+        if value is None:
+            return None
+        after = Q(**{f"{name}__lt": value})
+        if field.null:
+            after |= Q(**{f"{name}__isnull": True})
+        return after
+    if value is None:
+        return Q(**{f"{name}__isnull": False})
+    return Q(**{f"{name}__gt": value})
+
+
+def _keyset_filter(fields, values):
+    condition = None
+    equal = Q()
+    for (name, field, descending), value in zip(fields, values):
+        after = _after(name, field, descending, value)
+        if after is not None:
+            step = equal & after
+            condition = step if condition is None else condition | step
+        equal &= _equal(name, value)
+    return condition
+
+
+def _value_of(item, name):
+    if isinstance(item, dict):
+        return item[name]
+    return getattr(item, name)
+
+
+def order_queryset(queryset, ordering=("-created_at", "-id")):
+    """The queryset in the exact order paginate() reads it."""
+    return queryset.order_by(*_order_by(_parse_ordering(queryset.model, ordering)))
+
+
+def paginate(request, queryset, ordering=("-created_at", "-id"), page_size=None):
+    """
+    Return (items, next_cursor) for the requested page of `queryset`.
+    `ordering` must end with a unique field. `page_size` applies when the
+    request has no ?page_size (default: the max_page_size() cap).
+    next_cursor is None on the last page.
+    """
+    fields = _parse_ordering(queryset.model, ordering)
+    page_size = get_page_size(request, page_size)
+    queryset = queryset.order_by(*_order_by(fields))
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        condition = _keyset_filter(fields, decode_cursor(cursor, fields))
+        queryset = queryset.filter(condition) if condition is not None else queryset.none()
+
+    items = list(queryset[:page_size + 1])
+    if len(items) <= page_size:
+        return items, None
+    items = items[:page_size]
+    last = items[-1]
+    return items, encode_cursor([_value_of(last, name) for name, field, descending in fields])
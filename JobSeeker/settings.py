@@ -232,6 +232,68 @@ REST_FRAMEWORK = {
 
 TOKEN_MODEL = None
 
+# Caches. "search" holds job search results (Jobs/cache.py):
+# LocMemCache evicts least-recently-used entries past MAX_ENTRIES.
+# "shared" holds what every process must agree on (search cache version,
+# autocomplete/fuzzy change logs, viewer flags, Jobs/cache.py):
+# Redis when REDIS_URL is set, otherwise a database table (created by a
+# Jobs migration). The LocMem caches are per process.
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "jobs_shared_cache",
+        "OPTIONS": {
+            # one viewer flags entry per active seeker: the default 300 culls too early
+            "MAX_ENTRIES": config('SHARED_CACHE_MAX_ENTRIES', default=10000, cast=int),
+        },
+    }
+# How often a process re-reads the shared search version / index change logs
+SHARED_CACHE_CHECK_SECONDS = config('SHARED_CACHE_CHECK_SECONDS', default=1, cast=float)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": SHARED_CACHE,
+    "search": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "job-search",
+        "TIMEOUT": config('SEARCH_CACHE_TIMEOUT', default=300, cast=int),
+        "OPTIONS": {
+            "MAX_ENTRIES": config('SEARCH_CACHE_MAX_ENTRIES', default=2000, cast=int),
+            "CULL_FREQUENCY": 10,
+        },
+    },
+}
+
+# Search box autocomplete (Jobs/autocomplete.py)
+AUTOCOMPLETE_TOP_K = config('AUTOCOMPLETE_TOP_K', default=10, cast=int)
+AUTOCOMPLETE_REBUILD_SECONDS = config('AUTOCOMPLETE_REBUILD_SECONDS', default=600, cast=int)
+
+# Search result counts: exact up to the cap, estimated above it (Jobs/search.py)
+SEARCH_EXACT_COUNT_CAP = config('SEARCH_EXACT_COUNT_CAP', default=1000, cast=int)
+SEARCH_COUNT_SAMPLE_SIZE = config('SEARCH_COUNT_SAMPLE_SIZE', default=500, cast=int)
+
+# Cached saved/applied job ids per seeker for the listing flags (Jobs/viewer.py)
+VIEWER_FLAGS_TIMEOUT = config('VIEWER_FLAGS_TIMEOUT', default=300, cast=int)
+
+# Max applications per bulk status update request (Application/utils.py)
+BULK_STATUS_MAX_ITEMS = config('BULK_STATUS_MAX_ITEMS', default=500, cast=int)
+
+# Typo-tolerant trigram lookups (Jobs/fuzzy.py); Dice similarity 0..1
+FUZZY_MATCH_THRESHOLD = config('FUZZY_MATCH_THRESHOLD', default=0.4, cast=float)
+FUZZY_REBUILD_SECONDS = config('FUZZY_REBUILD_SECONDS', default=600, cast=int)
+
+# Keyset pagination for list endpoints (JobSeeker/pagination.py)
+PAGINATION_PAGE_SIZE = config('PAGINATION_PAGE_SIZE', default=20, cast=int)
+PAGINATION_MAX_PAGE_SIZE = config('PAGINATION_MAX_PAGE_SIZE', default=100, cast=int)
+
 
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
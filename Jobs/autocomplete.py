@@ -0,0 +1,269 @@
+# Jobs/autocomplete.py
+# In-memory prefix trie for the search box (/job/autocomplete/).
+#
+# Suggestions are live job titles, category names and company names,
+# weighted by how many live jobs carry them. Every word of a suggestion is
+# a key too, so "dev" finds "Python Developer". Each node caches its top
+# suggestions, so a lookup is one walk down the prefix.
+#
+# The trie is built lazily on the first lookup in a process, kept up to
+# date by Jobs/signals.py, and rebuilt from the database every
+# AUTOCOMPLETE_REBUILD_SECONDS (deadlines pass without any signal).
+# Every update is also appended to a change log in the shared cache
+# (Jobs/cache.py ChangeLog); the other processes replay it on a lookup,
+# at most once every SHARED_CACHE_CHECK_SECONDS, instead of rebuilding.
+import threading
+import time
+from types import SimpleNamespace
+from django.conf import settings
+from . import cache as search_cache
+
+
+def normalize(text):
+    return " ".join((text or "").split()).casefold()
+
+
+def _keys(label):
+    """'Python Developer' -> ['python developer', 'developer']"""
+    words = normalize(label).split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class _Node:
+    __slots__ = ("children", "terms", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.terms = set()
+        self.top = None  # cached [(weight, label, term), ...]
+
+
+class PrefixTrie:
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self.root = _Node()
+        self.labels = {}   # term -> display text
+        self.weights = {}  # term -> number of live jobs
+
+    def _path(self, key, create=False):
+        nodes = [self.root]
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return nodes, None
+                child = node.children[char] = _Node()
+            nodes.append(child)
+            node = child
+        return nodes, node
+
+    def _invalidate(self, term):
+        for key in _keys(self.labels[term]):
+            nodes, node = self._path(key)
+            for each in nodes:
+                each.top = None
+
+    def _link(self, term):
+        for key in _keys(self.labels[term]):
+            nodes, node = self._path(key, create=True)
+            node.terms.add(term)
+            for each in nodes:
+                each.top = None
+
+    def _unlink(self, term):
+        for key in _keys(self.labels[term]):
+            nodes, node = self._path(key)
+            if node is not None:
+                node.terms.discard(term)
+            for each in nodes:
+                each.top = None
+
+    def set_label(self, term, label):
+        if self.labels.get(term) == label:
+            return
+        if term in self.labels:
+            self._unlink(term)
+        self.labels[term] = label
+        self.weights.setdefault(term, 0)
+        self._link(term)
+
+    def discard(self, term):
+        if term in self.labels:
+            self._unlink(term)
+            del self.labels[term]
+            del self.weights[term]
+
+    def add_weight(self, term, amount):
+        if term not in self.labels:
+            return
+        self.weights[term] += amount
+        self._invalidate(term)
+
+    def _top(self, node):
+        if node.top is None:
+            found = {}
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                for term in current.terms:
+                    found[term] = (-self.weights[term], self.labels[term], term)
+                stack.extend(current.children.values())
+            node.top = sorted(found.values())[:self.top_k]
+        return node.top
+
+    def complete(self, prefix, limit=None):
+        nodes, node = self._path(normalize(prefix))
+        if node is None:
+            return []
+        return [
+            {"text": label, "type": term[0], "weight": -weight}
+            for weight, label, term in self._top(node)[:limit or self.top_k]
+        ]
+
+
+def _title_term(title):
+    return ("title", normalize(title))
+
+
+class AutocompleteIndex:
+    """PrefixTrie plus the per-job bookkeeping needed for incremental updates."""
+
+    def __init__(self, top_k=10):
+        self.trie = PrefixTrie(top_k)
+        self.job_terms = {}  # job id -> terms the job currently counts towards
+        self.built_at = time.monotonic()
+        self.generation = 0  # last change log entry applied
+
+    def _is_live(self, job):
+        return job.is_active and not job.is_expired
+
+    def add_job(self, job, category_name=None, company_name=None):
+        terms = []
+        if job.title and normalize(job.title):
+            term = _title_term(job.title)
+            if term not in self.trie.labels:
+                self.trie.set_label(term, job.title)
+            terms.append(term)
+        if job.category_id:
+            term = ("category", job.category_id)
+            if term not in self.trie.labels and category_name:
+                self.trie.set_label(term, category_name)
+            terms.append(term)
+        if job.employer_id:
+            term = ("company", job.employer_id)
+            if term not in self.trie.labels and company_name:
+                self.trie.set_label(term, company_name)
+            terms.append(term)
+        for term in terms:
+            self.trie.add_weight(term, 1)
+        self.job_terms[job.pk] = terms
+
+    def remove_job(self, job_id):
+        for term in self.job_terms.pop(job_id, []):
+            self.trie.add_weight(term, -1)
+            # titles only exist while some live job uses them
+            if term[0] == "title" and self.trie.weights.get(term, 0) <= 0:
+                self.trie.discard(term)
+
+    def update_job(self, job, category_name=None, company_name=None):
+        self.remove_job(job.pk)
+        if self._is_live(job):
+            self.add_job(job, category_name, company_name)
+
+    def rename(self, kind, pk, label):
+        if label and normalize(label):
+            self.trie.set_label((kind, pk), label)
+        else:
+            self.trie.discard((kind, pk))
+
+
+def build_index(top_k=10):
+    from EmployerProfile.models import EmployerProfile
+    from .models import Jobs, JobCategory
+
+    index = AutocompleteIndex(top_k)
+    for pk, name in JobCategory.objects.values_list("id", "name"):
+        index.rename("category", pk, name)
+    for pk, name in EmployerProfile.objects.values_list("id", "business_name"):
+        index.rename("company", pk, name)
+    for job in Jobs.objects.live().only("id", "title", "category_id", "employer_id").iterator():
+        index.add_job(job)
+    return index
+
+
+_log = search_cache.ChangeLog("autocomplete")
+_index = None
+_lock = threading.Lock()
+
+
+def _rebuild_seconds():
+    return getattr(settings, "AUTOCOMPLETE_REBUILD_SECONDS", 600)
+
+
+def _current(index, force=False):
+    """`index` with the changes logged since it was built, or a fresh build."""
+    if index is not None and time.monotonic() - index.built_at <= _rebuild_seconds():
+        changes = _log.changes_after(index.generation, force)
+        if changes is not None and all(method for number, (method, args) in changes):
+            for number, (method, args) in changes:
+                getattr(index, method)(*args)
+                index.generation = number
+            return index
+    generation = _log.tip()
+    index = build_index(getattr(settings, "AUTOCOMPLETE_TOP_K", 10))
+    index.generation = generation
+    return index
+
+
+def get_index():
+    global _index
+    with _lock:
+        _index = _current(_index)
+        return _index
+
+
+def suggest(prefix, limit=None):
+    index = get_index()
+    with _lock:
+        return index.trie.complete(prefix, limit)
+
+
+def _apply(method, *args):
+    """Log a change for every process and apply it (with any missed ones) here."""
+    global _index
+    with _lock:
+        number = _log.append((method, args), _index.generation if _index else 0, timeout=2 * _rebuild_seconds())
+        if number is None:
+            # not logged: rebuild here too rather than replay without it
+            _index = None
+        # nothing to update here until the first lookup has built the index
+        if _index is not None:
+            _index = _current(_index, force=True)
+
+
+def job_changed(job):
+    # only what the index reads, so the change log stays small
+    snapshot = SimpleNamespace(
+        pk=job.pk, title=job.title, category_id=job.category_id, employer_id=job.employer_id,
+        is_active=job.is_active, is_expired=job.is_expired,
+    )
+    category_name = job.category.name if job.category_id else None
+    company_name = job.employer.business_name if job.employer_id else None
+    _apply("update_job", snapshot, category_name, company_name)
+
+
+def job_removed(job_id):
+    _apply("remove_job", job_id)
+
+
+def renamed(kind, pk, label):
+    _apply("rename", kind, pk, label)
+
+
+def invalidate():
+    """Every process rebuilds its trie (e.g. after a bulk update)."""
+    global _index
+    with _lock:
+        _log.append((None, ()), _index.generation if _index else 0, timeout=2 * _rebuild_seconds())
+        _index = None
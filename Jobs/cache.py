@@ -0,0 +1,216 @@
+# Jobs/cache.py
+# Result cache for search and quick search.
+#
+# Results are stored in the "search" cache (settings.CACHES: LRU culling
+# + TTL) under a key built from the request parameters and a version
+# number. Any change to Jobs, JobCategory or EmployerProfile bumps the
+# version (Jobs/signals.py), which makes every older entry unreachable;
+# they then age out through LRU/TTL.
+#
+# The version lives in the "shared" cache (database table, or Redis when
+# REDIS_URL is set), not in the per-process "search" cache: a bump from
+# one web worker or from the close_expired_jobs command is seen by every
+# other process. Each process reads it at most once every
+# SHARED_CACHE_CHECK_SECONDS, so a lookup doesn't cost a round trip to the
+# shared cache. Versions are random tokens, never reused: no atomic
+# increment is needed, and a version lost to eviction can't come back.
+#
+# ChangeLog is how the in-memory autocomplete and fuzzy indexes follow
+# changes made in other processes: a numbered list of updates in the
+# shared cache, replayed by every process instead of rebuilding.
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_ALIAS = "search"
+SHARED_CACHE_ALIAS = "shared"
+VERSION_KEY = "jobs:search:version"
+
+# free-text params: "  Sittwe   Town " and "sittwe town" share an entry.
+# Everything else (cursor, fields, ...) is case sensitive and kept as sent.
+TEXT_PARAMS = {"q", "loc", "term"}
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+_tokens = {}  # shared key -> (value, time.monotonic() it was read)
+_tokens_lock = threading.Lock()
+
+
+def _cache():
+    return caches[SEARCH_CACHE_ALIAS]
+
+
+def shared_cache():
+    """The cache every process (web workers, management commands) shares."""
+    return caches[SHARED_CACHE_ALIAS]
+
+
+def normalize(value):
+    # "  Sittwe   Town " -> "sittwe town"
+    return " ".join(str(value or "").split()).casefold()
+
+
+def _check_seconds():
+    return getattr(settings, "SHARED_CACHE_CHECK_SECONDS", 1)
+
+
+def token(key):
+    """
+    Current value of a shared token, read from the shared cache at most
+    once every SHARED_CACHE_CHECK_SECONDS in this process.
+    """
+    now = time.monotonic()
+    with _tokens_lock:
+        cached = _tokens.get(key)
+    if cached and now - cached[1] < _check_seconds():
+        return cached[0]
+    cache = shared_cache()
+    value = cache.get(key)
+    if value is None:
+        value = uuid.uuid4().hex
+        if not cache.add(key, value, timeout=None):
+            value = cache.get(key, value)
+    with _tokens_lock:
+        _tokens[key] = (value, now)
+    return value
+
+
+def renew(key):
+    """
+    Give a shared token a new value. This process sees it at once, the
+    others within SHARED_CACHE_CHECK_SECONDS.
+    """
+    value = uuid.uuid4().hex
+    shared_cache().set(key, value, timeout=None)
+    with _tokens_lock:
+        _tokens[key] = (value, time.monotonic())
+    return value
+
+
+class ChangeLog:
+    """
+    Numbered changes in the shared cache, for in-memory indexes that every
+    process keeps up to date by replaying them.
+
+    append() claims the next number with cache.add(), which is atomic on
+    Redis and on the database cache alike (incr on the database cache is a
+    get + set: two processes can get the same number). Entries expire; a
+    reader that finds one gone gets None and rebuilds from the database.
+    """
+    BATCH = 20
+    MAX_ATTEMPTS = 20  # cache.add also returns False when the write fails
+
+    def __init__(self, name):
+        self.prefix = f"jobs:{name}:log"
+        self.tip_key = f"{self.prefix}:tip"
+        self.checked_at = None
+
+    def _key(self, number):
+        return f"{self.prefix}:{number}"
+
+    def tip(self):
+        """Last number handed out (a hint: it is written after the entry)."""
+        return shared_cache().get(self.tip_key, 0)
+
+    def append(self, change, after=0, timeout=3600):
+        """
+        Store `change` under the next free number after `after` and return
+        the number, None if the shared cache wouldn't take it.
+        """
+        cache = shared_cache()
+        number = max(after, self.tip()) + 1
+        for attempt in range(self.MAX_ATTEMPTS):
+            key = self._key(number)
+            if cache.add(key, change, timeout=timeout):
+                cache.set(self.tip_key, number, timeout=None)
+                return number
+            if cache.get(key) is None:
+                # not taken, the write failed (SQLite "database is locked"): retry it
+                time.sleep(random.uniform(0.5, 1.5) * min(0.01 * 2 ** attempt, 0.2))
+            else:
+                number = max(number, self.tip()) + 1
+        logger.warning("Could not append to the %s change log", self.prefix)
+        return None
+
+    def changes_after(self, number, force=False):
+        """
+        [(number, change), ...] appended after `number`, in order, or None
+        when some of them are gone. Unless `force`, the shared cache is read
+        at most once every SHARED_CACHE_CHECK_SECONDS; [] in between.
+        """
+        now = time.monotonic()
+        if not force and self.checked_at is not None and now - self.checked_at < _check_seconds():
+            return []
+        self.checked_at = now
+        cache = shared_cache()
+        changes = []
+        while True:
+            start = number + len(changes) + 1
+            keys = [self._key(n) for n in range(start, start + self.BATCH)]
+            found = cache.get_many(keys)
+            for n, key in enumerate(keys, start):
+                if key not in found:
+                    # handed out but missing: expired or evicted
+                    return None if self.tip() >= n else changes
+                changes.append((n, found[key]))
+
+
+def current_version():
+    return token(VERSION_KEY)
+
+
+def bump_version():
+    renew(VERSION_KEY)
+
+
+def cache_key(kind, params):
+    normalized = {
+        name: normalize(value) if name in TEXT_PARAMS else ("" if value is None else str(value))
+        for name, value in sorted(params.items())
+    }
+    digest = hashlib.sha1(json.dumps(normalized).encode()).hexdigest()
+    return f"jobs:search:v{current_version()}:{kind}:{digest}"
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_or_compute(kind, params, compute):
+    """
+    Return the cached result for (kind, params), or call compute() and
+    cache what it returns.
+    """
+    cache = _cache()
+    key = cache_key(kind, params)
+    result = cache.get(key)
+    if result is not None:
+        _count("hits")
+        return result
+    _count("misses")
+    result = compute()
+    cache.set(key, result)
+    return result
+
+
+def stats():
+    """Hit/miss counters of this worker process."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+        "version": current_version(),
+    }
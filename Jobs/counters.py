@@ -0,0 +1,128 @@
+# Jobs/counters.py
+# Stored application counters on Jobs.
+#
+# Jobs.applications_count and the per-status *_count columns are only
+# changed with F() updates, in the same transaction as the application
+# row (see Jobs/signals.py), so they never need a COUNT to be read.
+# reconcile_application_counts() checks and repairs drift caused by
+# bulk updates/deletes that bypass the signals.
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+# Application.status -> Jobs column
+STATUS_COUNT_FIELDS = {
+    "P": "pending_count",
+    "R": "review_count",
+    "SL": "shortlist_count",
+    "RJ": "rejected_count",
+    "H": "hired_count",
+}
+
+COUNT_FIELDS = ["applications_count", *STATUS_COUNT_FIELDS.values()]
+
+
+def _delta(field, amount):
+    if amount >= 0:
+        return F(field) + amount
+    return Greatest(F(field) + amount, 0)
+
+
+def counter_changes(total=0, statuses=None):
+    """
+    Build the update() kwargs for a change of `total` applications and
+    per-status amounts, e.g. counter_changes(1, {"P": 1}).
+    """
+    changes = {}
+    if total:
+        changes["applications_count"] = _delta("applications_count", total)
+    for code, amount in (statuses or {}).items():
+        field = STATUS_COUNT_FIELDS.get(code)
+        if field and amount:
+            changes[field] = _delta(field, amount)
+    return changes
+
+
+def bump_counters(job_id, total=0, statuses=None):
+    from .models import Jobs
+    changes = counter_changes(total, statuses)
+    if changes:
+        Jobs.objects.filter(pk=job_id).update(**changes)
+
+
+def application_added(job_id, status):
+    bump_counters(job_id, 1, {status: 1})
+
+
+def application_removed(job_id, status):
+    bump_counters(job_id, -1, {status: -1})
+
+
+def application_status_changed(job_id, old_status, new_status):
+    if old_status == new_status:
+        return
+    bump_counters(job_id, 0, {old_status: -1, new_status: 1})
+
+
+def actual_counts(application_model, job_ids):
+    """{job_id: {column: value}} computed from the Application table."""
+    counts = {job_id: dict.fromkeys(COUNT_FIELDS, 0) for job_id in job_ids}
+    rows = (
+        application_model.objects
+        .filter(job_id__in=job_ids)
+        .order_by()
+        .values("job_id", "status")
+        .annotate(total=Count("id"))
+    )
+    for row in rows:
+        job_counts = counts[row["job_id"]]
+        job_counts["applications_count"] += row["total"]
+        field = STATUS_COUNT_FIELDS.get(row["status"])
+        if field:
+            job_counts[field] += row["total"]
+    return counts
+
+
+def reconcile_application_counts(job_model=None, application_model=None, chunk_size=500, fix=True):
+    """
+    Compare the stored counters with the Application table, chunk by chunk.
+    Returns (jobs_checked, [(job_id, {column: (stored, actual)}), ...]).
+    With fix=True the drifted rows are rewritten with the actual values.
+    """
+    if job_model is None:
+        from .models import Jobs as job_model
+    if application_model is None:
+        from Application.models import Application as application_model
+
+    checked = 0
+    drifted = []
+    last_pk = None
+    while True:
+        with transaction.atomic():
+            jobs = job_model.objects.order_by("pk")
+            if last_pk is not None:
+                jobs = jobs.filter(pk__gt=last_pk)
+            if fix:
+                jobs = jobs.select_for_update()
+            rows = list(jobs.values("pk", *COUNT_FIELDS)[:chunk_size])
+            if not rows:
+                break
+            actual = actual_counts(application_model, [row["pk"] for row in rows])
+            for row in rows:
+                diff = {
+                    field: (row[field], actual[row["pk"]][field])
+                    for field in COUNT_FIELDS
+                    if row[field] != actual[row["pk"]][field]
+                }
+                if not diff:
+                    continue
+                drifted.append((row["pk"], diff))
+                if fix:
+                    job_model.objects.filter(pk=row["pk"]).update(
+                        **{field: values[1] for field, values in diff.items()}
+                    )
+        checked += len(rows)
+        last_pk = rows[-1]["pk"]
+        if len(rows) < chunk_size:
+            break
+    return checked, drifted
@@ -0,0 +1,41 @@
+# Jobs/expiry.py
+# Close jobs whose deadline has passed.
+#
+# Read paths use Jobs.objects.live() and never write; this sweeper flips
+# is_active in small chunks so each write transaction stays short.
+import time
+from django.db import transaction
+from django.utils import timezone
+from .models import Jobs
+from . import cache as search_cache
+from . import autocomplete, fuzzy
+
+
+def close_expired_jobs(chunk_size=500, pause=0, today=None):
+    """
+    Set is_active=False on every active job with deadline < today.
+    Works in chunks of `chunk_size` ids, sleeping `pause` seconds between
+    chunks. Returns the number of jobs closed.
+    """
+    today = today or timezone.localdate()
+    closed = 0
+    while True:
+        ids = list(
+            Jobs.objects
+            .filter(is_active=True, deadline__lt=today)
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            closed += Jobs.objects.filter(pk__in=ids, is_active=True).update(is_active=False)
+        if len(ids) < chunk_size:
+            break
+        if pause:
+            time.sleep(pause)
+    if closed:
+        # update() skips the signals, so drop cached search results here
+        search_cache.bump_version()
+        autocomplete.invalidate()
+        fuzzy.invalidate()
+    return closed
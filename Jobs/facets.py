@@ -0,0 +1,53 @@
+# Jobs/facets.py
+# Facet counts (location, job type, category, priority) for search results.
+#
+# All four facets come from one grouped query over the already-filtered
+# queryset; the per-facet totals are rolled up in Python.
+from collections import Counter
+from django.db.models import Count
+from .models import Jobs
+
+FACET_FIELDS = ("location", "job_type", "category", "priority")
+
+
+def _labels(choices):
+    return {code: str(label) for code, label in choices}
+
+
+def _bucket(counter, labels):
+    buckets = [
+        {"value": value, "label": labels.get(value, value), "count": count}
+        for value, count in counter.items()
+    ]
+    buckets.sort(key=lambda bucket: (-bucket["count"], str(bucket["label"] or "")))
+    return buckets
+
+
+def facet_counts(queryset):
+    """
+    Return {"location": [...], "job_type": [...], "category": [...],
+    "priority": [...]}, each a list of {"value", "label", "count"} sorted by
+    count. Counts respect every filter already applied to `queryset`.
+    """
+    rows = (
+        queryset
+        .order_by()
+        .values("location", "job_type", "category_id", "category__name", "priority")
+        .annotate(total=Count("id"))
+    )
+
+    counters = {field: Counter() for field in FACET_FIELDS}
+    category_names = {}
+    for row in rows:
+        counters["location"][row["location"]] += row["total"]
+        counters["job_type"][row["job_type"]] += row["total"]
+        counters["priority"][row["priority"]] += row["total"]
+        counters["category"][row["category_id"]] += row["total"]
+        category_names[row["category_id"]] = row["category__name"]
+
+    return {
+        "location": _bucket(counters["location"], _labels(Jobs.LOCATION_CHOICES)),
+        "job_type": _bucket(counters["job_type"], _labels(Jobs.JOB_TYPE_CHOICES)),
+        "category": _bucket(counters["category"], category_names),
+        "priority": _bucket(counters["priority"], _labels(Jobs.PRIORITY_CHOICES)),
+    }
@@ -0,0 +1,75 @@
+# Jobs/filters.py
+# Multi-criteria filter for /job/filter/.
+#
+#   ?location=SIT,Maungdaw&job_type=FULL&category=<uuid>&employer=<uuid>
+#   &salary_min=300k&salary_max=1000000&posted_within=7&priority=URGENT
+#
+# Every filter is an equality / IN / range on live() jobs ordered by
+# -created_at, so the common combinations are served by the partial
+# composite indexes on Jobs (see Jobs.Meta.indexes; Jobs/tests.py checks
+# the query plans).
+import uuid
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from .models import Jobs
+from .query import JOB_TYPE_CODES, PRIORITY_CODES, QueryError, parse_amount, resolve_codes
+
+FILTER_PARAMS = (
+    "location", "job_type", "category", "employer",
+    "salary_min", "salary_max", "posted_within", "priority",
+)
+
+
+def _list(raw):
+    return [item.strip() for item in (raw or "").split(",") if item.strip()]
+
+
+def _uuids(param, raw):
+    try:
+        return [uuid.UUID(item) for item in _list(raw)]
+    except ValueError:
+        raise ValidationError({param: "Must be a comma separated list of ids."})
+
+
+def parse_filters(params):
+    """Validate the query params into a dict of filters (400 on bad input)."""
+    filters = {}
+    if params.get("location"):
+        codes = set()
+        for name in _list(params["location"]):
+            found = Jobs.objects.location_codes(name)
+            if not found:
+                raise ValidationError({"location": f"Unknown location: {name}"})
+            codes.update(found)
+        filters["location__in"] = sorted(codes)
+    try:
+        if params.get("job_type"):
+            filters["job_type__in"] = resolve_codes(params["job_type"], JOB_TYPE_CODES, "type")
+        if params.get("priority"):
+            filters["priority__in"] = resolve_codes(params["priority"], PRIORITY_CODES, "priority")
+        if params.get("salary_min"):
+            filters["salary__gte"] = parse_amount(params["salary_min"])
+        if params.get("salary_max"):
+            filters["salary__lte"] = parse_amount(params["salary_max"])
+    except QueryError as error:
+        raise ValidationError({"detail": str(error)})
+    if params.get("category"):
+        filters["category_id__in"] = _uuids("category", params["category"])
+    if params.get("employer"):
+        filters["employer_id__in"] = _uuids("employer", params["employer"])
+    if params.get("posted_within"):
+        try:
+            days = int(params["posted_within"])
+        except ValueError:
+            raise ValidationError({"posted_within": "Must be a number of days."})
+        if days < 0:
+            raise ValidationError({"posted_within": "Must be a number of days."})
+        filters["created_at__gte"] = timezone.now() - timedelta(days=days)
+    return filters
+
+
+def filter_jobs(filters, queryset=None):
+    if queryset is None:
+        queryset = Jobs.objects.live()
+    return queryset.filter(**filters)
@@ -0,0 +1,224 @@
+# Jobs/fuzzy.py
+# Typo-tolerant lookups ("Sitwe", "Sittway", "Maung Daw") over township
+# labels, company names and live job titles.
+#
+# Every name is folded (casefold, only letters/digits) and split into
+# padded trigrams. An inverted index trigram -> names gives the candidates
+# that share at least one trigram with the query; they are ranked by the
+# Dice coefficient 2*|shared| / (|query| + |name|). Only the posting lists
+# of the query's trigrams are touched, never the whole index.
+#
+# Like Jobs/autocomplete.py the index lives in memory, is built on the
+# first lookup, updated by Jobs/signals.py, rebuilt every
+# FUZZY_REBUILD_SECONDS, and replays the shared change log (Jobs/cache.py
+# ChangeLog) to pick up changes made by other processes.
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from . import cache as search_cache
+
+_FOLD_RE = re.compile(r"[\W_]+")
+
+KINDS = ("location", "company", "title")
+
+
+def fold(text):
+    # "Maung Daw" / "MAUNGDAW" -> "maungdaw"
+    return _FOLD_RE.sub("", (text or "").casefold())
+
+
+def trigrams(text):
+    folded = fold(text)
+    if not folded:
+        return frozenset()
+    padded = f"  {folded} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    def __init__(self):
+        self.postings = defaultdict(set)  # trigram -> doc keys
+        self.docs = {}                    # (kind, folded) -> (label, value, trigrams)
+        self.refs = Counter()             # (kind, folded) -> number of owners
+
+    def add(self, kind, label, value=None):
+        key = (kind, fold(label))
+        if not key[1]:
+            return
+        self.refs[key] += 1
+        if key in self.docs:
+            return
+        grams = trigrams(label)
+        self.docs[key] = (label, label if value is None else value, grams)
+        for gram in grams:
+            self.postings[gram].add(key)
+
+    def remove(self, kind, label):
+        key = (kind, fold(label))
+        if key not in self.docs:
+            return
+        self.refs[key] -= 1
+        if self.refs[key] > 0:
+            return
+        del self.refs[key]
+        label, value, grams = self.docs.pop(key)
+        for gram in grams:
+            self.postings[gram].discard(key)
+            if not self.postings[gram]:
+                del self.postings[gram]
+
+    def lookup(self, text, kinds=None, threshold=0.4, limit=10):
+        grams = trigrams(text)
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            for key in self.postings.get(gram, ()):
+                shared[key] += 1
+
+        matches = []
+        for key, count in shared.items():
+            if kinds and key[0] not in kinds:
+                continue
+            label, value, doc_grams = self.docs[key]
+            score = 2 * count / (len(grams) + len(doc_grams))
+            if score >= threshold:
+                matches.append((-score, label, key[0], value))
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return [
+            {"text": label, "type": kind, "value": value, "score": round(-score, 3)}
+            for score, label, kind, value in matches[:limit]
+        ]
+
+
+class FuzzyIndex:
+    """TrigramIndex plus what each job/employer contributed, for updates."""
+
+    def __init__(self):
+        from .models import Jobs
+
+        self.trigrams = TrigramIndex()
+        self.job_titles = {}       # job id -> title
+        self.company_names = {}    # employer id -> business name
+        self.built_at = time.monotonic()
+        self.generation = 0  # last change log entry applied
+        for code, label in Jobs.LOCATION_CHOICES:
+            self.trigrams.add("location", label, code)
+
+    def set_job(self, job_id, title):
+        old = self.job_titles.pop(job_id, None)
+        if old is not None:
+            self.trigrams.remove("title", old)
+        if title:
+            self.job_titles[job_id] = title
+            self.trigrams.add("title", title)
+
+    def set_company(self, employer_id, name):
+        old = self.company_names.pop(employer_id, None)
+        if old is not None:
+            self.trigrams.remove("company", old)
+        if name:
+            self.company_names[employer_id] = name
+            self.trigrams.add("company", name)
+
+
+def build_index():
+    from EmployerProfile.models import EmployerProfile
+    from .models import Jobs
+
+    index = FuzzyIndex()
+    for pk, name in EmployerProfile.objects.values_list("id", "business_name"):
+        index.set_company(pk, name)
+    for pk, title in Jobs.objects.live().values_list("id", "title"):
+        index.set_job(pk, title)
+    return index
+
+
+_log = search_cache.ChangeLog("fuzzy")
+_index = None
+_lock = threading.Lock()
+
+
+def default_threshold():
+    return getattr(settings, "FUZZY_MATCH_THRESHOLD", 0.4)
+
+
+def _rebuild_seconds():
+    return getattr(settings, "FUZZY_REBUILD_SECONDS", 600)
+
+
+def _current(index, force=False):
+    """`index` with the changes logged since it was built, or a fresh build."""
+    if index is not None and time.monotonic() - index.built_at <= _rebuild_seconds():
+        changes = _log.changes_after(index.generation, force)
+        if changes is not None and all(method for number, (method, args) in changes):
+            for number, (method, args) in changes:
+                getattr(index, method)(*args)
+                index.generation = number
+            return index
+    generation = _log.tip()
+    index = build_index()
+    index.generation = generation
+    return index
+
+
+def get_index():
+    global _index
+    with _lock:
+        _index = _current(_index)
+        return _index
+
+
+def lookup(text, kinds=None, threshold=None, limit=10):
+    index = get_index()
+    if threshold is None:
+        threshold = default_threshold()
+    with _lock:
+        return index.trigrams.lookup(text, kinds, threshold, limit)
+
+
+def resolve_townships(text, threshold=None):
+    """
+    LOCATION_CHOICES codes of the township(s) most similar to `text`.
+    Only the best score is kept: "Maung Daw" is MAUNGDAW, not MANAUNG too.
+    """
+    matches = lookup(text, ["location"], threshold, limit=5)
+    if not matches:
+        return []
+    best = matches[0]["score"]
+    return [match["value"] for match in matches if match["score"] == best]
+
+
+def _apply(method, *args):
+    """Log a change for every process and apply it (with any missed ones) here."""
+    global _index
+    with _lock:
+        number = _log.append((method, args), _index.generation if _index else 0, timeout=2 * _rebuild_seconds())
+        if number is None:
+            # not logged: rebuild here too rather than replay without it
+            _index = None
+        if _index is not None:
+            _index = _current(_index, force=True)
+
+
+def job_changed(job):
+    live = job.is_active and not job.is_expired
+    _apply("set_job", job.pk, job.title if live else None)
+
+
+def job_removed(job_id):
+    _apply("set_job", job_id, None)
+
+
+def company_renamed(employer_id, name):
+    _apply("set_company", employer_id, name)
+
+
+def invalidate():
+    """Every process rebuilds its index (e.g. after a bulk update)."""
+    global _index
+    with _lock:
+        _log.append((None, ()), _index.generation if _index else 0, timeout=2 * _rebuild_seconds())
+        _index = None
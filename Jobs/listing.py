@@ -0,0 +1,132 @@
+# Jobs/listing.py
+# Fast read path for job listings (cards).
+#
+# Same output as JobListSerializer, built from one values() row per job
+# (employer/category names joined in the same query) instead of model
+# instances + the ModelSerializer field machinery:
+#
+#   jobs, next_cursor = paginate(request, card_values(jobs), ("-created_at", "-id"))
+#   data = job_cards(jobs)
+#
+# Both take the ?fields= / ?omit= selection (JobSeeker/fieldsets.py): only
+# the columns and joins behind the selected fields are queried.
+#
+# Jobs/tests.py (JobCardParityTests) checks both outputs stay identical;
+# `python manage.py bench_job_cards` times them.
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from .models import Jobs
+from .serializers import JobListSerializer
+
+CARD_VALUES = [
+    "id", "employer_id", "employer__business_name", "employer__logo",
+    "category_id", "category__name", "title", "description_excerpt",
+    "location", "job_type", "priority", "applications_count", "salary",
+    "is_active", "max_applicants", "deadline", "created_at", "updated_at",
+]
+
+# values() columns behind each card field, when not just its own name
+CARD_SOURCES = {
+    "employer_business_name": ("employer_id", "employer__business_name"),
+    "employer_logo": ("employer_id", "employer__logo"),
+    "category": ("category_id",),
+    "category_name": ("category_id", "category__name"),
+    "location_display": ("location",),
+    "job_type_display": ("job_type",),
+    "priority_display": ("priority",),
+    "application_count": ("applications_count",),
+    "is_active": ("is_active", "deadline"),
+}
+
+# value -> label, as get_FOO_display() (last label wins for the duplicated MB)
+LOCATION_LABELS = dict(Jobs.LOCATION_CHOICES)
+JOB_TYPE_LABELS = dict(Jobs.JOB_TYPE_CHOICES)
+PRIORITY_LABELS = dict(Jobs.PRIORITY_CHOICES)
+
+_fields = None
+
+
+def _serializer_fields():
+    # JobListSerializer's own fields, only used to format primitive values
+    # (salary, dates) exactly the same way
+    global _fields
+    if _fields is None:
+        _fields = JobListSerializer().fields
+    return _fields
+
+
+def card_values(queryset, selection=None):
+    if selection is None:
+        return queryset.values(*CARD_VALUES)
+    columns = {"id", "created_at"}  # read by the pagination cursor
+    for name in selection:
+        columns.update(CARD_SOURCES.get(name, (name,)))
+    return queryset.values(*[column for column in CARD_VALUES if column in columns])
+
+
+class _Row(dict):
+    # missing columns read as None; the fields built from them are dropped
+    def __missing__(self, key):
+        return None
+
+
+def _display(labels, value):
+    if value is None:
+        return None
+    return str(labels.get(value, value))
+
+
+def _format(name, value):
+    if value is None:
+        return None
+    return _serializer_fields()[name].to_representation(value)
+
+
+def _logo_url(name, request):
+    if not name:
+        return None
+    url = default_storage.url(name)
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+def job_card(row, request=None, today=None, selection=None):
+    if selection is not None:
+        row = _Row(row)  # only the columns of the selected fields (card_values)
+    today = today or timezone.localdate()
+    is_active = row["is_active"]
+    if is_active and row["deadline"] is not None and row["deadline"] < today:
+        is_active = False  # past its deadline, same rule as JobsSerializer
+
+    card = {"id": str(row["id"])}
+    # like DRF, the employer/category fields are left out when there is none
+    if row["employer_id"] is not None:
+        card["employer_business_name"] = row["employer__business_name"]
+        card["employer_logo"] = _logo_url(row["employer__logo"], request)
+    card["category"] = row["category_id"]
+    if row["category_id"] is not None:
+        card["category_name"] = row["category__name"]
+    card.update({
+        "title": row["title"],
+        "description_excerpt": row["description_excerpt"],
+        "location": row["location"],
+        "location_display": _display(LOCATION_LABELS, row["location"]),
+        "job_type": row["job_type"],
+        "job_type_display": _display(JOB_TYPE_LABELS, row["job_type"]),
+        "priority": row["priority"],
+        "priority_display": _display(PRIORITY_LABELS, row["priority"]),
+        "application_count": row["applications_count"],
+        "salary": _format("salary", row["salary"]),
+        "is_active": is_active,
+        "max_applicants": row["max_applicants"],
+        "deadline": _format("deadline", row["deadline"]),
+        "created_at": _format("created_at", row["created_at"]),
+        "updated_at": _format("updated_at", row["updated_at"]),
+    })
+    if selection is not None:
+        card = {name: value for name, value in card.items() if name in selection}
+    return card
+
+
+def job_cards(rows, request=None, selection=None):
+    today = timezone.localdate()
+    return [job_card(row, request, today, selection) for row in rows]
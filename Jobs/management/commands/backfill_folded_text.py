@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from EmployerProfile.models import EmployerProfile
+from JobSeeker.text import backfill_folded_fields, plain_excerpt
+from Jobs.models import Jobs, JobCategory
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the *_folded search columns (NFC, Zawgyi -> Unicode, "
+        "casefold, no whitespace) for jobs, categories and employers, "
+        "and the plain-text job description excerpts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for model in (JobCategory, EmployerProfile, Jobs):
+            updated = backfill_folded_fields(model, model.FOLDED_FIELDS, chunk_size=options["chunk_size"])
+            self.stdout.write(f"{model.__name__}: updated {updated} row(s).")
+        updated = backfill_folded_fields(
+            Jobs, Jobs.EXCERPT_FIELDS, chunk_size=options["chunk_size"], transform=plain_excerpt
+        )
+        self.stdout.write(f"Jobs excerpts: updated {updated} row(s).")
+        self.stdout.write(self.style.SUCCESS(
+            "Done. Run rebuild_job_search_index if job text changed."
+        ))
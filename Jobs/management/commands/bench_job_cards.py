@@ -0,0 +1,80 @@
+import time
+import uuid
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from Jobs.listing import card_values, job_cards
+from Jobs.models import Jobs, JobCategory
+from Jobs.serializers import JobsSerializer
+from JobSeeker.text import plain_excerpt
+
+
+class Command(BaseCommand):
+    help = (
+        "Time a job listing built by the values()-based cards (Jobs/listing.py) "
+        "against JobsSerializer(many=True) on the same rows, rendered to JSON. "
+        "--synthetic N adds N throwaway jobs inside a transaction that is "
+        "rolled back. Jobs/tests.py checks the two outputs match."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--synthetic", type=int, default=0)
+        parser.add_argument("--limit", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["synthetic"]:
+                self.create_jobs(options["synthetic"])
+            self.bench(options["limit"], options["repeat"])
+            transaction.set_rollback(True)
+
+    def create_jobs(self, count):
+        tag = uuid.uuid4().hex[:8]
+        user = CustomUser.objects.create_user(email=f"cards-{tag}@example.com")
+        employer = EmployerProfile.objects.create(
+            user=user, first_name="Card", last_name="Bench", business_name=f"Cards {tag}", city="Sittwe",
+        )
+        category = JobCategory.objects.create(name=f"Cards {tag}")
+        locations = [code for code, label in Jobs.LOCATION_CHOICES]
+        Jobs.objects.bulk_create([
+            Jobs(
+                employer=employer,
+                category=category if i % 7 else None,
+                title=f"Job {i}", description="<p>x</p>" * 100,
+                description_excerpt=plain_excerpt("<p>x</p>" * 100),
+                location=locations[i % len(locations)],
+                salary=100000 + i if i % 3 else None,
+                deadline=date(2020, 1, 1) if i % 11 == 0 else None,
+                is_active=bool(i % 5),
+            )
+            for i in range(count)
+        ])
+
+    def bench(self, limit, repeat):
+        queryset = Jobs.objects.order_by("-created_at", "-id")[:limit]
+        rows = queryset.count()
+        if not rows:
+            self.stdout.write("No jobs to list, use --synthetic N.")
+            return
+        render = JSONRenderer().render
+
+        def serializer_listing():
+            return JobsSerializer(queryset.select_related("employer", "category"), many=True).data
+
+        def card_listing():
+            return job_cards(card_values(queryset))
+
+        timings = {}
+        for name, build in (("JobsSerializer", serializer_listing), ("job_cards", card_listing)):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                render(build())
+            timings[name] = (time.perf_counter() - started) / repeat
+            self.stdout.write(f"{name}: {timings[name] * 1000:.1f} ms per listing of {rows} job(s)")
+        self.stdout.write(self.style.SUCCESS(
+            f"job_cards is {timings['JobsSerializer'] / timings['job_cards']:.1f}x faster."
+        ))
@@ -0,0 +1,59 @@
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from JobSeeker.text import segment_text, syllables
+
+# building blocks of synthetic Burmese syllables
+CONSONANTS = [chr(c) for c in range(0x1000, 0x1022)]
+MEDIALS = ["", "", "", "ျ", "ြ", "ွ", "ှ", "ြွ"]
+VOWELS = ["", "ာ", "ိ", "ီ", "ု", "ူ", "ေ", "ဲ", "ော"]
+FINALS = ["", "", "င်", "န်", "မ်", "တ်", "ံ"]
+TONES = ["", "", "့", "း"]
+
+
+def make_syllable(rng):
+    return "".join([
+        rng.choice(CONSONANTS), rng.choice(MEDIALS), rng.choice(VOWELS),
+        rng.choice(FINALS), rng.choice(TONES),
+    ])
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of the Myanmar syllable tokenizer used by "
+        "the job search index on a synthetic corpus (no spaces inside words, "
+        "like real Burmese text)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--syllables", type=int, default=500_000)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        total = options["syllables"]
+
+        words = []
+        made = 0
+        while made < total:
+            size = min(rng.randint(1, 4), total - made)
+            words.append("".join(make_syllable(rng) for _ in range(size)))
+            made += size
+        # ~ a job description per line
+        lines = [" ".join(words[i:i + 40]) for i in range(0, len(words), 40)]
+        corpus_bytes = sum(len(line.encode()) for line in lines)
+
+        started = time.perf_counter()
+        segmented = [segment_text(line) for line in lines]
+        elapsed = time.perf_counter() - started
+
+        found = sum(len(syllables(line.replace(" ", ""))) for line in lines)
+        if found != total:
+            raise CommandError(f"Tokenizer found {found} syllables, corpus has {total}.")
+
+        self.stdout.write(
+            f"{total} syllables, {len(lines)} lines, {corpus_bytes / 1e6:.1f} MB: "
+            f"{elapsed:.2f}s, {total / elapsed:,.0f} syllables/s, "
+            f"{corpus_bytes / 1e6 / elapsed:.1f} MB/s"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Sample: {segmented[0][:80]}"))
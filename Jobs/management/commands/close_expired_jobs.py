@@ -0,0 +1,29 @@
+import time
+from django.core.management.base import BaseCommand
+from Jobs.expiry import close_expired_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Close jobs whose deadline has passed. Run it from cron, or with "
+        "--loop as a long-running worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--pause", type=float, default=0.05,
+                            help="Seconds to sleep between chunks.")
+        parser.add_argument("--loop", action="store_true",
+                            help="Keep running, sweeping every --interval seconds.")
+        parser.add_argument("--interval", type=int, default=600)
+
+    def handle(self, *args, **options):
+        while True:
+            closed = close_expired_jobs(
+                chunk_size=options["chunk_size"],
+                pause=options["pause"],
+            )
+            self.stdout.write(f"Closed {closed} expired job(s).")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
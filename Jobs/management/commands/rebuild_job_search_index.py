@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from Jobs import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text job search index from the Jobs table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if not search.search_index_available():
+            self.stdout.write(self.style.WARNING(
+                "Full-text index is only used on SQLite; nothing to rebuild."
+            ))
+            return
+        with transaction.atomic():
+            count = search.rebuild_index(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} job(s)."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from Jobs.counters import reconcile_application_counts
+
+
+class Command(BaseCommand):
+    help = "Check the stored application counters on Jobs and repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Only report drift, don't fix it.")
+
+    def handle(self, *args, **options):
+        checked, drifted = reconcile_application_counts(
+            chunk_size=options["chunk_size"],
+            fix=not options["dry_run"],
+        )
+        for job_id, diff in drifted:
+            changes = ", ".join(
+                f"{field} {stored} -> {actual}" for field, (stored, actual) in diff.items()
+            )
+            self.stdout.write(f"{job_id}: {changes}")
+        verb = "Found" if options["dry_run"] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {checked} job(s). {verb} {len(drifted)} with drifted counters."
+        ))
@@ -0,0 +1,64 @@
+import re
+
+from django.db import migrations
+
+# Frozen copy of the index as Jobs/search.py defined it when this migration
+# was written. Don't import Jobs.search here: later changes to it must not
+# change what this migration does (0016 recreates the table for the new tokenizer).
+SEARCH_TABLE = "jobs_search_index"
+SEARCH_COLUMNS = ["job_id", "title", "location", "category", "company", "description", "compact"]
+_TOKEN_RE = re.compile(r"[\w\u1000-\u109f]+")
+
+
+def _compact(*values):
+    return " ".join("".join(_TOKEN_RE.findall(value.lower())) for value in values if value)
+
+
+def _document(job):
+    category = job.category.name if job.category_id else ""
+    company = job.employer.business_name if job.employer_id else ""
+    location = " ".join(filter(None, [job.location, job.get_location_display()]))
+    return [
+        job.id.hex,
+        job.title or "",
+        location,
+        category,
+        company,
+        job.description or "",
+        _compact(job.title, category, company),
+    ]
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        f"{', '.join(SEARCH_COLUMNS)}, tokenize='unicode61 remove_diacritics 2')"
+    )
+    Jobs = apps.get_model("Jobs", "Jobs")
+    jobs = Jobs.objects.using(schema_editor.connection.alias).select_related("category", "employer")
+    placeholders = ", ".join(["%s"] * len(SEARCH_COLUMNS))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} ({', '.join(SEARCH_COLUMNS)}) VALUES ({placeholders})",
+            [_document(job) for job in jobs.order_by("pk").iterator()],
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0012_remove_jobcategory_unique_category_per_employer_and_more"),
+        ("EmployerProfile", "0002_employerprofile_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
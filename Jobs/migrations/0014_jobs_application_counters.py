@@ -0,0 +1,78 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:36
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# Application.status -> Jobs column, frozen here instead of importing
+# Jobs.counters so later changes to it can't change this migration
+STATUS_COUNT_FIELDS = {
+    "P": "pending_count",
+    "R": "review_count",
+    "SL": "shortlist_count",
+    "RJ": "rejected_count",
+    "H": "hired_count",
+}
+
+
+def backfill_counters(apps, schema_editor):
+    db = schema_editor.connection.alias
+    Jobs = apps.get_model("Jobs", "Jobs")
+    Application = apps.get_model("Application", "Application")
+    counts = {}
+    rows = (
+        Application.objects.using(db)
+        .order_by()
+        .values("job_id", "status")
+        .annotate(total=Count("id"))
+    )
+    for row in rows:
+        job_counts = counts.setdefault(row["job_id"], {"applications_count": 0})
+        job_counts["applications_count"] += row["total"]
+        field = STATUS_COUNT_FIELDS.get(row["status"])
+        if field:
+            job_counts[field] = job_counts.get(field, 0) + row["total"]
+    # the columns were just added with default=0: only jobs with applications change
+    for job_id, job_counts in counts.items():
+        Jobs.objects.using(db).filter(pk=job_id).update(**job_counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Jobs', '0013_jobs_search_index'),
+        ('Application', '0005_savejob_created_at_alter_application_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobs',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='hired_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='shortlist_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+from Jobs.migrations._text import backfill_folded_fields
+
+
+def backfill_folded(apps, schema_editor):
+    db = schema_editor.connection.alias
+    backfill_folded_fields(apps.get_model("Jobs", "JobCategory"), {"name": "name_folded"}, db)
+    backfill_folded_fields(
+        apps.get_model("Jobs", "Jobs"),
+        {"title": "title_folded", "description": "description_folded"},
+        db,
+    )
+    # the search index is refilled with normalized text by 0016
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Jobs', '0014_jobs_application_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobcategory',
+            name='name_folded',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='description_folded',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobs',
+            name='title_folded',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=300),
+        ),
+        migrations.RunPython(backfill_folded, migrations.RunPython.noop),
+    ]
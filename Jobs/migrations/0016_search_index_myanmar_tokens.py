@@ -0,0 +1,70 @@
+import re
+
+from django.db import migrations
+
+from Jobs.migrations._text import normalize_text, segment_text
+
+# Frozen copy of the index as Jobs/search.py defined it when this migration
+# was written (don't import Jobs.search: later changes to it must not change
+# what this migration does).
+SEARCH_TABLE = "jobs_search_index"
+SEARCH_COLUMNS = ["job_id", "title", "location", "category", "company", "description", "compact"]
+_TOKEN_RE = re.compile(r"[\w\u1000-\u109f]+")
+_TOKEN_CHARS = "".join(chr(c) for c in range(0x102B, 0x103F)) + "".join(chr(c) for c in range(0x1056, 0x105A))
+TOKENIZER = f"unicode61 remove_diacritics 2 tokenchars '{_TOKEN_CHARS}'"
+
+
+def _compact(*values):
+    return " ".join(
+        "".join(_TOKEN_RE.findall(normalize_text(value).casefold())) for value in values if value
+    )
+
+
+def _index_text(text):
+    return segment_text(normalize_text(text))
+
+
+def _document(job):
+    category = job.category.name if job.category_id else ""
+    company = job.employer.business_name if job.employer_id else ""
+    location = " ".join(filter(None, [job.location, job.get_location_display()]))
+    return [
+        job.id.hex,
+        _index_text(job.title),
+        location,
+        _index_text(category),
+        _index_text(company),
+        _index_text(job.description),
+        _compact(job.title, category, company),
+    ]
+
+
+def recreate_search_index(apps, schema_editor):
+    # the tokenizer changed (Myanmar marks are token characters now and
+    # Burmese text is indexed per syllable): the table must be recreated
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        f"{', '.join(SEARCH_COLUMNS)}, tokenize=\"{TOKENIZER}\")"
+    )
+    Jobs = apps.get_model("Jobs", "Jobs")
+    jobs = Jobs.objects.using(schema_editor.connection.alias).select_related("category", "employer")
+    placeholders = ", ".join(["%s"] * len(SEARCH_COLUMNS))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} ({', '.join(SEARCH_COLUMNS)}) VALUES ({placeholders})",
+            [_document(job) for job in jobs.order_by("pk").iterator()],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0015_folded_text_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(recreate_search_index, migrations.RunPython.noop),
+    ]
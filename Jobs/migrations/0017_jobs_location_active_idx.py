@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EmployerProfile', '0003_employerprofile_business_name_folded'),
+        ('Jobs', '0016_search_index_myanmar_tokens'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(fields=['location', 'is_active'], name='jobs_location_active_idx'),
+        ),
+    ]
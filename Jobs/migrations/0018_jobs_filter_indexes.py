@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EmployerProfile', '0003_employerprofile_business_name_folded'),
+        ('Jobs', '0017_jobs_location_active_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='jobs',
+            name='jobs_location_active_idx',
+        ),
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='jobs_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['location', '-created_at', '-id'], name='jobs_active_loc_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['job_type', '-created_at', '-id'], name='jobs_active_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='jobs_category_created_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+from Jobs.migrations._text import backfill_folded_fields, plain_excerpt
+
+
+def backfill_excerpt(apps, schema_editor):
+    backfill_folded_fields(
+        apps.get_model("Jobs", "Jobs"),
+        {"description": "description_excerpt"},
+        schema_editor.connection.alias,
+        transform=plain_excerpt,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Jobs', '0018_jobs_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobs',
+            name='description_excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_excerpt, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:58
+
+from django.db import migrations, models
+
+
+def backfill_rank(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    # Jobs.PRIORITY_RANKS when this was written; everything else keeps 1
+    for priority, rank in {"FEATURED": 3, "URGENT": 2}.items():
+        Jobs.objects.filter(priority=priority).update(priority_rank=rank)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EmployerProfile', '0003_employerprofile_business_name_folded'),
+        ('Jobs', '0019_jobs_description_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobs',
+            name='priority_rank',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(backfill_rank, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobs',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-priority_rank', '-created_at', '-id'], name='jobs_active_rank_created_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# The "shared" cache (settings.CACHES) is a database table unless REDIS_URL
+# is set; create it with the schema so deployments need no extra step.
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    call_command("createcachetable", database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0020_jobs_priority_rank"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
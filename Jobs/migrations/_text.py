@@ -0,0 +1,188 @@
+# Jobs/migrations/_text.py
+# Frozen copy of the JobSeeker/text.py helpers the data migrations use
+# (Jobs 0015, 0016, 0019 and EmployerProfile 0003). The leading underscore
+# keeps the migration loader from treating this module as a migration.
+#
+# Migrations must keep writing the same rows however JobSeeker/text.py
+# changes later, so don't update this copy or import the live module here:
+# a change to the folding rules gets its own data migration.
+import html
+import re
+import unicodedata
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# Zawgyi-only code points / orderings
+_ZAWGYI_RE = re.compile(
+    r"[\u105a\u1060-\u1097]"                     # Zawgyi presentation forms
+    r"|(?:^|[^\u1000-\u1021\u103b-\u103f])\u1031"  # vowel e typed before its consonant
+    r"|(?:^|[^\u1000-\u1021])\u103b"               # ya-yit typed before its consonant
+    r"|\u1039(?![\u1000-\u1021])"                  # Zawgyi asat (Unicode virama needs a consonant)
+)
+
+# Zawgyi code point -> Unicode sequence
+_ZAWGYI_MAP = {
+    "\u1039": "\u103a",            # asat
+    "\u103a": "\u103b",            # ya-pin
+    "\u103b": "\u103c",            # ya-yit
+    "\u103c": "\u103d",            # wa-hswe
+    "\u103d": "\u103e",            # ha-hto
+    "\u1033": "\u102f",
+    "\u1034": "\u1030",
+    "\u105a": "\u102b\u103a",
+    "\u1064": "\u1004\u103a\u1039",  # kinzi
+    "\u106a": "\u1009",
+    "\u106b": "\u100a",
+    "\u106e": "\u100d\u1039\u100d",
+    "\u106f": "\u100d\u1039\u100e",
+    "\u1070": "\u1039\u100f",
+    "\u107d": "\u103b",
+    "\u107e": "\u103c", "\u107f": "\u103c", "\u1080": "\u103c",
+    "\u1081": "\u103c", "\u1082": "\u103c", "\u1083": "\u103c", "\u1084": "\u103c",
+    "\u1086": "\u103f",
+    "\u1087": "\u103e",
+    "\u1088": "\u103e\u102f",
+    "\u1089": "\u103e\u1030",
+    "\u108a": "\u103d\u103e",
+    "\u108b": "\u1004\u103a\u1039\u102d",
+    "\u108c": "\u1004\u103a\u1039\u102e",
+    "\u108d": "\u1004\u103a\u1039\u1036",
+    "\u108f": "\u1014",
+    "\u1090": "\u101b",
+    "\u1091": "\u100f\u1039\u100d",
+    "\u1092": "\u100b\u1039\u100c",
+    "\u1094": "\u1037",
+    "\u1095": "\u1037",
+    "\u1097": "\u100b\u1039\u100b",
+}
+# stacked (subjoined) consonants U+1060..U+1069, U+106C, U+106D, U+1071..U+107C, U+1085, U+1093, U+1096
+_ZAWGYI_MAP.update({
+    "\u1060": "\u1039\u1000", "\u1061": "\u1039\u1001", "\u1062": "\u1039\u1002",
+    "\u1063": "\u1039\u1003", "\u1065": "\u1039\u1005", "\u1066": "\u1039\u1006",
+    "\u1067": "\u1039\u1006", "\u1068": "\u1039\u1007", "\u1069": "\u1039\u1008",
+    "\u106c": "\u1039\u100b", "\u106d": "\u1039\u100c",
+    "\u1071": "\u1039\u1010", "\u1072": "\u1039\u1010", "\u1073": "\u1039\u1011",
+    "\u1074": "\u1039\u1011", "\u1075": "\u1039\u1012", "\u1076": "\u1039\u1013",
+    "\u1077": "\u1039\u1014", "\u1078": "\u1039\u1015", "\u1079": "\u1039\u1016",
+    "\u107a": "\u1039\u1017", "\u107b": "\u1039\u1018", "\u107c": "\u1039\u1019",
+    "\u1085": "\u1039\u101c", "\u1093": "\u1039\u1018", "\u1096": "\u1039\u1010\u103d",
+})
+_ZAWGYI_TABLE = str.maketrans(_ZAWGYI_MAP)
+
+_CONSONANT = "[\u1000-\u1021\u103f]"
+
+# Zawgyi stores kinzi after its consonant, Unicode before it
+_KINZI_RE = re.compile(rf"({_CONSONANT})(\u1004\u103a\u1039)")
+
+# Zawgyi stores vowel e / ya-yit before the consonant, Unicode after it:
+# (e)(ya-yit)(consonant)(stacked)(medials) -> consonant stacked ya-yit medials e
+_PREFIX_RE = re.compile(
+    rf"(\u1031?)(\u103c?)(\u1004\u103a\u1039)?({_CONSONANT})((?:\u1039{_CONSONANT})?)([\u103b\u103d\u103e]*)"
+)
+_REORDER = [
+    (re.compile(r"\u103e\u103d"), "\u103d\u103e"),
+    (re.compile(r"\u103e\u103b"), "\u103b\u103e"),
+    (re.compile(r"\u1037\u103a"), "\u103a\u1037"),
+    (re.compile(r"([\u1036\u1037])([\u102f\u1030])"), r"\2\1"),
+    (re.compile(r"\u1036\u102d"), "\u102d\u1036"),
+]
+
+
+def _reorder_syllable(match):
+    e, ya_yit, kinzi, consonant, stacked, medials = match.groups()
+    return f"{kinzi or ''}{consonant}{stacked}{ya_yit}{medials}{e}"
+
+
+def looks_like_zawgyi(text):
+    return bool(text) and bool(_ZAWGYI_RE.search(text))
+
+
+def zawgyi_to_unicode(text):
+    text = text.translate(_ZAWGYI_TABLE)
+    text = _KINZI_RE.sub(r"\2\1", text)
+    text = _PREFIX_RE.sub(_reorder_syllable, text)
+    for pattern, replacement in _REORDER:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def normalize_text(text):
+    """NFC, with Zawgyi converted to Unicode. Case and spaces are kept."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text)
+    if looks_like_zawgyi(text):
+        text = unicodedata.normalize("NFC", zawgyi_to_unicode(text))
+    return text
+
+
+def fold_text(text):
+    """normalize_text + casefold + every whitespace removed: 'Web  Dev' -> 'webdev'"""
+    return "".join(normalize_text(text).casefold().split())
+
+
+# tags that separate words once the markup is gone
+_BLOCK_TAG_RE = re.compile(r"<\s*/?\s*(?:br|p|div|li|ul|ol|h[1-6]|tr|td|th|blockquote)\b[^>]*>", re.IGNORECASE)
+EXCERPT_LENGTH = 200
+
+
+def plain_excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Rich text (CKEditor HTML) -> normalized plain text on one line, cut to
+    at most `length` characters ("…" included).
+    """
+    if not text:
+        return ""
+    text = html.unescape(strip_tags(_BLOCK_TAG_RE.sub(" ", text)))
+    text = " ".join(normalize_text(text).split())
+    return Truncator(text).chars(length)
+
+
+def backfill_folded_fields(model, folded_fields, using, chunk_size=500, transform=fold_text):
+    """
+    Recompute the folded columns of every row of the (historical) `model`
+    on database `using`. Only rows whose value changed are written.
+    """
+    rows = model.objects.using(using).order_by("pk").only("pk", *folded_fields, *folded_fields.values())
+    last_pk = None
+    while True:
+        chunk = list((rows.filter(pk__gt=last_pk) if last_pk is not None else rows)[:chunk_size])
+        if not chunk:
+            break
+        changed = []
+        for row in chunk:
+            dirty = False
+            for source, folded in folded_fields.items():
+                value = transform(getattr(row, source))
+                if getattr(row, folded) != value:
+                    setattr(row, folded, value)
+                    dirty = True
+            if dirty:
+                changed.append(row)
+        if changed:
+            model.objects.using(using).bulk_update(changed, list(folded_fields.values()))
+        last_pk = chunk[-1].pk
+
+
+# Myanmar syllable breaking (rule based, after the "sylbreak" rules):
+# a syllable starts at a consonant that is not stacked under a virama and
+# not killed by an asat/virama, or at an independent vowel / symbol.
+# Burmese is written without spaces between words, so syllables are the
+# smallest useful search terms.
+MYANMAR_RUN_RE = re.compile(r"[\u1000-\u109f]+")
+_SYLLABLE_BREAK_RE = re.compile(
+    r"(?<!\u1039)(?=[\u1000-\u1021](?![\u103a\u1039]))"
+    r"|(?=[\u1023-\u102a\u103f\u1040-\u104f])"
+)
+
+
+def syllables(text):
+    """'ကျောင်းဆရာ' -> ['ကျောင်း', 'ဆ', 'ရာ'] (non-Myanmar text is kept whole)"""
+    return [part for part in _SYLLABLE_BREAK_RE.split(text or "") if part]
+
+
+def segment_text(text):
+    """Put a space between the syllables of every Myanmar run in `text`."""
+    if not text:
+        return ""
+    return MYANMAR_RUN_RE.sub(lambda match: " ".join(syllables(match.group())), text)
@@ -1,8 +1,13 @@
 from django.db import models
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 from EmployerProfile.models import EmployerProfile
+from JobSeeker.text import fill_folded_fields, fold_text, plain_excerpt
 from Accounts.models import CustomUser
+import re
 import uuid
+from functools import cached_property
 
 class JobCategory(models.Model):
     id = models.UUIDField(
@@ -11,6 +16,8 @@ class JobCategory(models.Model):
         editable=False         # User လက်နဲ့ မပြင်နိုင်အောင် lock
     )
     name = models.CharField(max_length=100)
+    # fold_text(name), kept by save() (JobSeeker/text.py)
+    name_folded = models.CharField(max_length=200, blank=True, default="", editable=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True,blank=True,null=True)
     updated_at = models.DateTimeField(auto_now=True,blank=True,null=True)
     user=models.ForeignKey(CustomUser,on_delete=models.CASCADE,blank=True,null=True)
@@ -23,22 +30,56 @@ class JobCategory(models.Model):
             )
         ]
 
+    FOLDED_FIELDS = {"name": "name_folded"}
+
+    def save(self, *args, **kwargs):
+        kwargs["update_fields"] = fill_folded_fields(self, self.FOLDED_FIELDS, kwargs.get("update_fields"))
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
+def location_key(text):
+    # "Mrauk-U" / "MRAUK U" / "mrauku" -> "mrauku"
+    return re.sub(r"[\W_]+", "", (text or "").casefold())
+
+
 #manager job
 class JobsManager(models.Manager):  
+
+    @cached_property
+    def location_codes_by_key(self):
+        # label and code -> codes; MB is listed twice (MINBRAR and MYEBON),
+        # so both labels resolve to MB
+        codes = {}
+        for code, label in self.model.LOCATION_CHOICES:
+            codes.setdefault(location_key(label), set()).add(code)
+            codes.setdefault(location_key(code), set()).add(code)
+        return codes
+
+    def location_codes(self, city_name):
+        return sorted(self.location_codes_by_key.get(location_key(city_name), ()))
+
+    def live(self):
+        # open jobs: active and deadline not passed yet.
+        # expired jobs are closed in the background (close_expired_jobs),
+        # so reads must not trust is_active alone.
+        today = timezone.localdate()
+        return self.get_queryset().filter(is_active=True).filter(
+            Q(deadline__isnull=True) | Q(deadline__gte=today)
+        )
      
     def quick_search_by_city(self, city_name):
-        qs=self.get_queryset()
+        # exact code match (indexed) on open jobs only
+        qs=self.live()
         if city_name:
-            qs=qs.filter(location__icontains=city_name)
+            qs=qs.filter(location__in=self.location_codes(city_name))
         return qs 
     
     def quick_search_by_category(self, category_name):
         qs=self.get_queryset()
         if category_name:
-            qs=qs.filter(category__name__icontains=category_name)
+            qs=qs.filter(category__name_folded__contains=fold_text(category_name))
         return qs
 
 
@@ -88,6 +129,11 @@ class Jobs(models.Model):
     employer=models.ForeignKey(EmployerProfile, on_delete=models.CASCADE,blank=True,null=True,related_name="jobs")
     title = models.CharField(max_length=150)
     description = models.TextField()
+    # fold_text() of title/description, kept by save() (JobSeeker/text.py)
+    title_folded = models.CharField(max_length=300, blank=True, default="", editable=False, db_index=True)
+    description_folded = models.TextField(blank=True, default="", editable=False)
+    # plain_excerpt(description), kept by save(): what list/search endpoints show
+    description_excerpt = models.CharField(max_length=255, blank=True, default="", editable=False)
     location = models.CharField(choices=LOCATION_CHOICES,default='MO',null=True)
     job_type = models.CharField(choices=JOB_TYPE_CHOICES,default='FULL',null=True)
     salary = models.DecimalField(max_digits=12,decimal_places=2, null=True, blank=True)
@@ -105,8 +151,64 @@ class Jobs(models.Model):
         default="NORMAL",blank=True,null=True,
         help_text="Use FEATURED for top placement or URGENT for visible badge."
     )
+    # featured-first sort key, kept in sync with priority by save()
+    priority_rank = models.PositiveSmallIntegerField(default=1, editable=False)
+
+    # Application counters, kept in sync by Jobs/counters.py (never edit by hand)
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_count = models.PositiveIntegerField(default=0, editable=False)
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    shortlist_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+    hired_count = models.PositiveIntegerField(default=0, editable=False)
 
     objects = JobsManager()
 
+    FOLDED_FIELDS = {"title": "title_folded", "description": "description_folded"}
+    EXCERPT_FIELDS = {"description": "description_excerpt"}
+    PRIORITY_RANKS = {"FEATURED": 3, "URGENT": 2}  # anything else: 1
+
+    class Meta:
+        # Listing/filter paths: live jobs, newest first. is_active is the
+        # index condition rather than its first column: Django emits a bare
+        # "is_active" for is_active=True, which SQLite can't seek on, but
+        # it does match the partial index WHERE clause. The trailing "-id"
+        # completes the (-created_at, -id) keyset pagination order.
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], condition=Q(is_active=True), name="jobs_active_created_idx"),
+            models.Index(fields=["location", "-created_at", "-id"], condition=Q(is_active=True), name="jobs_active_loc_created_idx"),
+            models.Index(fields=["job_type", "-created_at", "-id"], condition=Q(is_active=True), name="jobs_active_type_created_idx"),
+            models.Index(fields=["category", "-created_at", "-id"], name="jobs_category_created_idx"),
+            # search: featured first, then newest
+            models.Index(fields=["-priority_rank", "-created_at", "-id"], condition=Q(is_active=True), name="jobs_active_rank_created_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # counters are only written with F() updates; don't write back a
+        # stale in-memory copy when the job itself is edited
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            from .counters import COUNT_FIELDS
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNT_FIELDS
+            ]
+        kwargs["update_fields"] = fill_folded_fields(self, self.FOLDED_FIELDS, kwargs.get("update_fields"))
+        kwargs["update_fields"] = fill_folded_fields(
+            self, self.EXCERPT_FIELDS, kwargs.get("update_fields"), transform=plain_excerpt
+        )
+        self.priority_rank = self.rank_of(self.priority)
+        update_fields = kwargs["update_fields"]
+        if update_fields is not None and "priority" in update_fields and "priority_rank" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "priority_rank"]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def rank_of(cls, priority):
+        return cls.PRIORITY_RANKS.get(priority, 1)
+
+    @property
+    def is_expired(self):
+        return self.deadline is not None and self.deadline < timezone.localdate()
+
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -0,0 +1,233 @@
+# Jobs/query.py
+# Small query language for the search box:
+#
+#   title:driver loc:SIT type:FULL salary>=300000 company:"Arakan Co" night shift
+#
+#   field:value / field:"quoted value"   title, company, category -> full-text
+#                                         index, scoped to that column
+#                                         loc, type, priority -> exact codes
+#                                         (comma = any of: loc:SIT,MD)
+#   salary>=N  salary<N  salary:N-M      N may be 300000, 300,000, 300k, 3lakh
+#   "quoted phrase"                      words adjacent, in order
+#   anything else                        free text, like the plain `q`
+#
+# parse_query() is pure and cached (lru_cache), apply_query() turns the
+# result into ORM filters + one FTS MATCH expression.
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from django.db.models import FloatField, Q, Value
+from JobSeeker.text import fold_text
+from .models import Jobs, location_key
+from . import search, fuzzy
+
+FIELD_ALIASES = {
+    "title": "title",
+    "company": "company",
+    "employer": "company",
+    "category": "category",
+    "cat": "category",
+    "loc": "location",
+    "location": "location",
+    "city": "location",
+    "type": "job_type",
+    "job_type": "job_type",
+    "priority": "priority",
+    "salary": "salary",
+}
+
+# text fields -> FTS column / folded column for the non-SQLite fallback
+TEXT_FIELDS = {
+    "title": ("title", "title_folded"),
+    "company": ("company", "employer__business_name_folded"),
+    "category": ("category", "category__name_folded"),
+}
+
+SALARY_UNITS = {"": 1, "k": 1_000, "lakh": 100_000, "lakhs": 100_000, "m": 1_000_000}
+SALARY_OPS = {">=": "gte", ">": "gt", "<=": "lte", "<": "lt", "=": "exact", ":": "exact"}
+
+_PART_RE = re.compile(
+    r'(?P<field>[A-Za-z_]+)(?P<op>>=|<=|:|>|<|=)(?:"(?P<quoted>[^"]*)"?|(?P<value>\S*))'
+    r'|"(?P<phrase>[^"]*)"?'
+    r'|(?P<word>\S+)'
+)
+_AMOUNT_RE = re.compile(r"^(\d[\d,]*(?:\.\d+)?)\s*([a-z]*)$")
+
+ParsedQuery = namedtuple("ParsedQuery", [
+    "words",        # ("night", "shift")
+    "phrases",      # ("full time",)
+    "text_fields",  # (("company", "Arakan Co", True), ...)
+    "locations",    # ("SIT",) raw values, resolved to codes by apply_query
+    "job_types",    # ("FULL",)
+    "priorities",   # ("URGENT",)
+    "salary",       # (("gte", Decimal("300000")), ...)
+    "errors",       # ("Unknown type: xyz",)
+])
+
+
+class QueryError(ValueError):
+    pass
+
+
+def choice_codes(choices):
+    codes = {}
+    for code, label in choices:
+        codes[location_key(code)] = code
+        codes[location_key(label)] = code
+    return codes
+
+
+JOB_TYPE_CODES = choice_codes(Jobs.JOB_TYPE_CHOICES)
+PRIORITY_CODES = choice_codes(Jobs.PRIORITY_CHOICES)
+
+
+def parse_amount(text):
+    match = _AMOUNT_RE.match(text.strip().casefold())
+    if not match or match.group(2) not in SALARY_UNITS:
+        raise QueryError(f"Invalid salary: {text}")
+    try:
+        return Decimal(match.group(1).replace(",", "")) * SALARY_UNITS[match.group(2)]
+    except InvalidOperation:
+        raise QueryError(f"Invalid salary: {text}")
+
+
+def _salary(op, value):
+    if op in (":", "=") and re.search(r"-|\.\.", value):
+        low, high = re.split(r"-|\.\.", value, maxsplit=1)
+        return [("gte", parse_amount(low)), ("lte", parse_amount(high))]
+    return [(SALARY_OPS[op], parse_amount(value))]
+
+
+def resolve_codes(value, known, label):
+    codes = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        code = known.get(location_key(item))
+        if code is None:
+            raise QueryError(f"Unknown {label}: {item}")
+        codes.append(code)
+    return codes
+
+
+@lru_cache(maxsize=1024)
+def parse_query(text):
+    words, phrases, text_fields = [], [], []
+    locations, job_types, priorities, salary, errors = [], [], [], [], []
+
+    for part in _PART_RE.finditer(text or ""):
+        if part.group("phrase") is not None:
+            if part.group("phrase").strip():
+                phrases.append(part.group("phrase").strip())
+            continue
+        if part.group("word") is not None:
+            words.append(part.group("word"))
+            continue
+
+        field = FIELD_ALIASES.get(part.group("field").casefold())
+        op = part.group("op")
+        quoted = part.group("quoted") is not None
+        value = (part.group("quoted") if quoted else part.group("value")).strip()
+        if field is None or (field != "salary" and op not in (":", "=")):
+            # not ours (e.g. "10:30" or "c++"): plain text
+            words.append(part.group(0))
+            continue
+        if not value:
+            continue
+        try:
+            if field in TEXT_FIELDS:
+                text_fields.append((field, value, quoted))
+            elif field == "location":
+                locations.extend(item.strip() for item in value.split(",") if item.strip())
+            elif field == "job_type":
+                job_types.extend(resolve_codes(value, JOB_TYPE_CODES, "type"))
+            elif field == "priority":
+                priorities.extend(resolve_codes(value, PRIORITY_CODES, "priority"))
+            else:
+                salary.extend(_salary(op, value))
+        except QueryError as error:
+            errors.append(str(error))
+
+    return ParsedQuery(
+        tuple(words), tuple(phrases), tuple(text_fields), tuple(locations),
+        tuple(job_types), tuple(priorities), tuple(salary), tuple(errors),
+    )
+
+
+def _location_codes(values):
+    codes = set()
+    for value in values:
+        codes.update(Jobs.objects.location_codes(value) or fuzzy.resolve_townships(value))
+    return codes
+
+
+def apply_query(queryset, parsed):
+    """
+    Filter a Jobs queryset by a ParsedQuery. Always adds `search_rank`
+    (bm25 when the full-text index was used, 0 otherwise).
+    """
+    no_rank = Value(0.0, output_field=FloatField())
+    if parsed.errors:
+        raise QueryError("; ".join(parsed.errors))
+
+    if parsed.locations:
+        queryset = queryset.filter(location__in=_location_codes(parsed.locations))
+    if parsed.job_types:
+        queryset = queryset.filter(job_type__in=parsed.job_types)
+    if parsed.priorities:
+        queryset = queryset.filter(priority__in=parsed.priorities)
+    for lookup, amount in parsed.salary:
+        queryset = queryset.filter(**{f"salary__{lookup}": amount})
+
+    free_text = " ".join(parsed.words)
+    if not (free_text or parsed.phrases or parsed.text_fields):
+        return queryset.annotate(search_rank=no_rank)
+
+    if not search.search_index_available():
+        for phrase in parsed.phrases:
+            folded = fold_text(phrase)
+            queryset = queryset.filter(Q(title_folded__contains=folded) | Q(description_folded__contains=folded))
+        for field, value, quoted in parsed.text_fields:
+            queryset = queryset.filter(**{f"{TEXT_FIELDS[field][1]}__contains": fold_text(value)})
+        if free_text:
+            return search.search_jobs(queryset, free_text)
+        return queryset.annotate(search_rank=no_rank)
+
+    match = build_match(parsed)
+    if not match:
+        # something was asked for but has no searchable word in it ("!!!")
+        return queryset.none().annotate(search_rank=no_rank)
+    return search.search_jobs(queryset, free_text, match=match)
+
+
+def search_ordering(parsed):
+    """
+    Featured first (stored Jobs.priority_rank), then best match, then
+    newest. Without text terms search_rank is 0 everywhere and is left
+    out, so the order is exactly jobs_active_rank_created_idx: no sort.
+    """
+    if build_match(parsed) is None:
+        return ["-priority_rank", "-created_at", "-id"]
+    return ["-priority_rank", "search_rank", "-created_at", "-id"]
+
+
+def build_match(parsed):
+    """
+    The FTS MATCH expression for the text parts of `parsed`: None when it
+    has none, "" when they hold no searchable word.
+    """
+    free_text = " ".join(parsed.words)
+    if not (free_text or parsed.phrases or parsed.text_fields):
+        return None
+    clauses = []
+    if free_text:
+        clauses.append(search.build_match_query(free_text))
+    clauses += [search.column_match(phrase, phrase=True) for phrase in parsed.phrases]
+    clauses += [
+        search.column_match(value, TEXT_FIELDS[field][0], phrase=quoted)
+        for field, value, quoted in parsed.text_fields
+    ]
+    if not all(clauses):
+        return ""
+    return " AND ".join(f"({clause})" for clause in clauses)
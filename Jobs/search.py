@@ -0,0 +1,273 @@
+# Jobs/search.py
+# Full-text search index for jobs (SQLite FTS5).
+#
+# The index is a virtual table that shadows Jobs together with the category
+# name and the employer business name. It is kept in sync by Jobs/signals.py
+# and can be rebuilt with `python manage.py rebuild_job_search_index`.
+import re
+import uuid
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, Value, FloatField
+from JobSeeker.text import normalize_text, fold_text, segment_text
+
+SEARCH_TABLE = "jobs_search_index"
+
+# columns of the FTS table (job_id is only used to find a row again)
+SEARCH_COLUMNS = ["job_id", "title", "location", "category", "company", "description", "compact"]
+MATCH_COLUMNS = "{title location category company description compact}"
+
+# bm25 weight per column, same order as SEARCH_COLUMNS
+BM25_WEIGHTS = (0.0, 10.0, 2.0, 5.0, 4.0, 1.0, 3.0)
+
+_TOKEN_RE = re.compile(r"[\w\u1000-\u109f]+")
+
+# Myanmar vowel signs, medials, asat, tone marks: part of a token, not
+# separators/diacritics, otherwise unicode61 keeps only the consonants.
+# Burmese text is stored one syllable per term (JobSeeker.text.segment_text).
+_TOKEN_CHARS = "".join(chr(c) for c in range(0x102B, 0x103F)) + "".join(chr(c) for c in range(0x1056, 0x105A))
+TOKENIZER = f"unicode61 remove_diacritics 2 tokenchars '{_TOKEN_CHARS}'"
+
+
+def search_index_available():
+    return connection.vendor == "sqlite"
+
+
+def create_index(schema_editor):
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        f"{', '.join(SEARCH_COLUMNS)}, tokenize=\"{TOKENIZER}\")"
+    )
+
+
+def drop_index(schema_editor):
+    schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+def _tokens(text):
+    # same normalization on both sides: Zawgyi and Unicode index alike
+    return _TOKEN_RE.findall(normalize_text(text).casefold())
+
+
+def _compact(*values):
+    # "Web Development" -> "webdevelopment", so "WebDev" still finds it
+    return " ".join("".join(_tokens(value)) for value in values if value)
+
+
+def _index_text(text):
+    return segment_text(normalize_text(text))
+
+
+def build_document(job):
+    """
+    Return the row stored in the index for a job.
+    Works with historical models too (used by the migration).
+    """
+    category = job.category.name if job.category_id else ""
+    company = job.employer.business_name if job.employer_id else ""
+    location = " ".join(filter(None, [job.location, job.get_location_display()]))
+    return [
+        job.id.hex,
+        _index_text(job.title),
+        location,
+        _index_text(category),
+        _index_text(company),
+        _index_text(job.description),
+        _compact(job.title, category, company),
+    ]
+
+
+def _delete_rows(cursor, job_ids):
+    for job_id in job_ids:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN "
+            f"(SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s)",
+            [f'job_id:"{job_id.hex}"'],
+        )
+
+
+def _insert_rows(cursor, documents):
+    placeholders = ", ".join(["%s"] * len(SEARCH_COLUMNS))
+    cursor.executemany(
+        f"INSERT INTO {SEARCH_TABLE} ({', '.join(SEARCH_COLUMNS)}) VALUES ({placeholders})",
+        documents,
+    )
+
+
+def index_jobs(jobs):
+    """(Re)index the given job instances."""
+    if not search_index_available():
+        return
+    jobs = list(jobs)
+    if not jobs:
+        return
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, [job.id for job in jobs])
+        _insert_rows(cursor, [build_document(job) for job in jobs])
+
+
+def index_job(job):
+    index_jobs([job])
+
+
+def remove_jobs(job_ids):
+    if not search_index_available():
+        return
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, job_ids)
+
+
+def reindex_queryset(queryset, chunk_size=500):
+    queryset = queryset.select_related("category", "employer").order_by("pk")
+    count = 0
+    batch = []
+    for job in queryset.iterator(chunk_size=chunk_size):
+        batch.append(job)
+        if len(batch) >= chunk_size:
+            index_jobs(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        index_jobs(batch)
+        count += len(batch)
+    return count
+
+
+def rebuild_index(model=None, chunk_size=500):
+    """
+    Drop every row of the index and rebuild it from the Jobs table.
+    `model` lets the migration pass the historical Jobs model.
+    """
+    if not search_index_available():
+        return 0
+    if model is None:
+        from .models import Jobs as model
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+    count = 0
+    batch = []
+    queryset = model.objects.select_related("category", "employer").order_by("pk")
+    for job in queryset.iterator(chunk_size=chunk_size):
+        batch.append(build_document(job))
+        if len(batch) >= chunk_size:
+            with connection.cursor() as cursor:
+                _insert_rows(cursor, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        with connection.cursor() as cursor:
+            _insert_rows(cursor, batch)
+        count += len(batch)
+    return count
+
+
+def column_match(text, columns=MATCH_COLUMNS, phrase=False):
+    """
+    MATCH clause for `text` in `columns` ("title" or "{title company}").
+    Every word is a quoted prefix term (so user input can never break the
+    FTS syntax), a Burmese word becomes a phrase of its syllables; with
+    phrase=True all the words must be adjacent, in order.
+    """
+    tokens = _tokens(text)
+    if not tokens:
+        return ""
+    if phrase:
+        terms = '"' + " ".join(segment_text(token) for token in tokens) + '"'
+    else:
+        # "ကျောင်းဆရာ" -> "ကျောင်း ဆ ရာ"*, the syllables must be adjacent
+        terms = " ".join(f'"{segment_text(token)}"*' for token in tokens)
+    return f"{columns}: ({terms})"
+
+
+def build_match_query(q):
+    """
+    Turn free text into an FTS5 MATCH expression: every word in any
+    column, or the space-less form against `compact`.
+    """
+    tokens = _tokens(q)
+    if not tokens:
+        return ""
+    match = column_match(q)
+    if len(tokens) > 1:
+        match += f' OR compact: "{"".join(tokens)}"*'
+    return match
+
+
+def search_jobs(queryset, q, match=None):
+    """
+    Restrict a Jobs queryset to the full-text matches of `q` and add a
+    `search_rank` (bm25, lower is better) that can be used in order_by().
+    `match` is a ready-made MATCH expression (Jobs/query.py) used instead
+    of the one built from `q`; `q` is then only the non-SQLite fallback.
+    """
+    no_rank = Value(0.0, output_field=FloatField())
+    if not search_index_available():
+        folded = fold_text(q)
+        return queryset.filter(
+            Q(title_folded__contains=folded) |
+            Q(location__icontains=q) |
+            Q(category__name_folded__contains=folded) |
+            Q(employer__business_name_folded__contains=folded) |
+            Q(description_folded__contains=folded)
+        ).annotate(search_rank=no_rank)
+
+    match = match or build_match_query(q)
+    if not match:
+        return queryset.none().annotate(search_rank=no_rank)
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+    jobs_table = queryset.model._meta.db_table
+    return queryset.extra(
+        select={"search_rank": f"bm25({SEARCH_TABLE}, {weights})"},
+        tables=[SEARCH_TABLE],
+        where=[
+            f'{SEARCH_TABLE}.job_id = "{jobs_table}"."id"',
+            f"{SEARCH_TABLE} MATCH %s",
+        ],
+        params=[match],
+    )
+
+
+def match_count(match):
+    """Number of index rows matching `match` (index only, no join)."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", [match])
+        return cursor.fetchone()[0]
+
+
+def match_sample(match, size):
+    """Random job ids among the index rows matching `match`."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT job_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s ORDER BY random() LIMIT %s",
+            [match, size],
+        )
+        return [uuid.UUID(row[0]) for row in cursor.fetchall()]
+
+
+def count_hits(queryset, match=None):
+    """
+    Return (count, exact) for a search queryset.
+
+    Up to SEARCH_EXACT_COUNT_CAP hits are counted exactly (a LIMITed count,
+    so it never reads more than cap + 1 rows). Above that, for a full-text
+    query, the count is estimated: the index-only number of MATCH hits
+    times the share of a random sample of them that passes the other
+    filters (live, location, ...). Without a MATCH the remaining filters
+    are indexed and the exact count is used.
+    """
+    cap = getattr(settings, "SEARCH_EXACT_COUNT_CAP", 1000)
+    queryset = queryset.order_by()
+    limited = queryset.values("pk")[:cap + 1].count()
+    if limited <= cap:
+        return limited, True
+    if not match or not search_index_available():
+        return queryset.count(), True
+
+    total = match_count(match)
+    sample = match_sample(match, getattr(settings, "SEARCH_COUNT_SAMPLE_SIZE", 500))
+    if not sample:
+        return limited, False
+    passed = queryset.filter(pk__in=sample).count()
+    estimate = round(total * passed / len(sample))
+    # we know there are more than cap hits, and never more than the index has
+    return min(max(estimate, cap + 1), total), False
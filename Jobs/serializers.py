@@ -3,6 +3,7 @@ from rest_framework import serializers
 from .models import JobCategory, Jobs
 from Accounts.models import CustomUser
 from EmployerProfile.models import EmployerProfile
+from JobSeeker.fieldsets import SparseFieldsMixin
 
 class JobCategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,8 +12,21 @@ class JobCategorySerializer(serializers.ModelSerializer):
     
 
     
-class JobsSerializer(serializers.ModelSerializer):
-    application_count = serializers.SerializerMethodField()
+class JobsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    # model paths each field reads, for ?fields= / ?omit= (JobSeeker/fieldsets.py)
+    FIELD_SOURCES = {
+        "application_count": ("applications_count",),
+        "employer_business_name": ("employer__business_name",),
+        "employer_logo": ("employer__logo",),
+        "category_name": ("category__name",),
+        "location_display": ("location",),
+        "job_type_display": ("job_type",),
+        "priority_display": ("priority",),
+        "is_active": ("is_active", "deadline"),
+    }
+
+    # stored counter on Jobs, no COUNT query per row
+    application_count = serializers.IntegerField(source="applications_count", read_only=True)
     employer_business_name = serializers.CharField(
         source="employer.business_name",
         read_only=True
@@ -29,8 +43,12 @@ class JobsSerializer(serializers.ModelSerializer):
     job_type_display = serializers.CharField(source='get_job_type_display', read_only=True)
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
 
-    def get_application_count(self, job):
-        return job.applications.count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # a job past its deadline is closed even before the sweeper runs
+        if data.get("is_active") and instance.is_expired:
+            data["is_active"] = False
+        return data
     
     class Meta:
         model = Jobs
@@ -42,6 +60,7 @@ class JobsSerializer(serializers.ModelSerializer):
             "category_name",
             "title",
             "description",
+            "description_excerpt",
 
             # Choices field + display
             "location",
@@ -62,6 +81,13 @@ class JobsSerializer(serializers.ModelSerializer):
         read_only_fields = ["employer"]
 
 
+class JobListSerializer(JobsSerializer):
+    # list screens show description_excerpt; the full description is only
+    # sent by jobs_detail
+    class Meta(JobsSerializer.Meta):
+        fields = [name for name in JobsSerializer.Meta.fields if name != "description"]
+
+
 
     
     
@@ -1,10 +1,14 @@
 # jobs/signals.py
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_save, pre_save, post_delete, pre_delete
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
-from .models import Jobs
-from Application.models import Application
+from .models import Jobs, JobCategory
+from . import search, counters
+from . import cache as search_cache
+from . import autocomplete, fuzzy, viewer
+from EmployerProfile.models import EmployerProfile
+from Application.models import Application, SaveJob
 from Notification.models import Notification  # adjust if your app name is different
 
 # -------- Job created -> notify employer --------
@@ -41,7 +45,7 @@ def notify_on_application_created(sender, instance, created, **kwargs):
 # -------- Track old status before save (for status-change detection) --------
 @receiver(pre_save, sender=Application)
 def cache_old_status(sender, instance, **kwargs):
-    if not instance.pk:
+    if not instance.pk or instance._state.adding:
         instance._old_status = None
         return
     try:
@@ -51,3 +55,144 @@ def cache_old_status(sender, instance, **kwargs):
         instance._old_status = None
         
 # -------- Application status changed -> notify jobseeker --------
+
+
+# -------- Stored application counters on Jobs --------
+@receiver(post_save, sender=Application)
+def count_application_on_save(sender, instance, created, **kwargs):
+    if created:
+        # apply_to_job reserves its slot on the counter before inserting
+        if not getattr(instance, "_counters_reserved", False):
+            counters.application_added(instance.job_id, instance.status)
+    elif hasattr(instance, "_old_status"):
+        counters.application_status_changed(instance.job_id, instance._old_status, instance.status)
+        instance._old_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def count_application_on_delete(sender, instance, **kwargs):
+    counters.application_removed(instance.job_id, instance.status)
+
+
+# -------- Keep the full-text search index in sync --------
+@receiver(post_save, sender=Jobs)
+def index_job_on_save(sender, instance, **kwargs):
+    search.index_job(instance)
+
+
+@receiver(post_delete, sender=Jobs)
+def remove_job_from_index(sender, instance, **kwargs):
+    search.remove_jobs([instance.pk])
+
+
+@receiver(post_save, sender=JobCategory)
+def reindex_jobs_on_category_save(sender, instance, created, **kwargs):
+    if created:
+        return
+    search.reindex_queryset(Jobs.objects.filter(category=instance))
+
+
+@receiver(pre_delete, sender=JobCategory)
+def remember_category_jobs(sender, instance, **kwargs):
+    # category is SET_NULL on jobs, so grab the ids before they are cleared
+    instance._search_job_ids = list(Jobs.objects.filter(category=instance).values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=JobCategory)
+def reindex_jobs_on_category_delete(sender, instance, **kwargs):
+    job_ids = getattr(instance, "_search_job_ids", None)
+    if job_ids:
+        search.reindex_queryset(Jobs.objects.filter(pk__in=job_ids))
+
+
+@receiver(pre_save, sender=EmployerProfile)
+def cache_old_business_name(sender, instance, update_fields=None, **kwargs):
+    # only the company name is indexed: remember it to skip other saves
+    instance._old_business_name = None
+    if not instance.pk or instance._state.adding:
+        return
+    if update_fields is not None and "business_name" not in update_fields:
+        instance._old_business_name = instance.business_name
+        return
+    instance._old_business_name = (
+        EmployerProfile.objects.filter(pk=instance.pk).values_list("business_name", flat=True).first()
+    )
+
+
+def business_name_changed(instance, created):
+    return not created and instance.business_name != getattr(instance, "_old_business_name", None)
+
+
+@receiver(post_save, sender=EmployerProfile)
+def reindex_jobs_on_employer_save(sender, instance, created, **kwargs):
+    if not business_name_changed(instance, created):
+        return
+    search.reindex_queryset(Jobs.objects.filter(employer=instance))
+
+
+# -------- Invalidate cached search results (version bump) --------
+@receiver(post_save, sender=Jobs)
+@receiver(post_delete, sender=Jobs)
+@receiver(post_save, sender=JobCategory)
+@receiver(post_delete, sender=JobCategory)
+@receiver(post_save, sender=EmployerProfile)
+def invalidate_search_cache(sender, **kwargs):
+    transaction.on_commit(search_cache.bump_version)
+
+
+# -------- Keep the in-memory indexes (autocomplete, fuzzy) in sync --------
+@receiver(post_save, sender=Jobs)
+def sync_memory_indexes_on_job_save(sender, instance, **kwargs):
+    def sync():
+        autocomplete.job_changed(instance)
+        fuzzy.job_changed(instance)
+    transaction.on_commit(sync)
+
+
+@receiver(post_delete, sender=Jobs)
+def sync_memory_indexes_on_job_delete(sender, instance, **kwargs):
+    job_id = instance.pk
+
+    def sync():
+        autocomplete.job_removed(job_id)
+        fuzzy.job_removed(job_id)
+    transaction.on_commit(sync)
+
+
+@receiver(post_save, sender=JobCategory)
+def sync_memory_indexes_on_category_save(sender, instance, **kwargs):
+    transaction.on_commit(lambda: autocomplete.renamed("category", instance.pk, instance.name))
+
+
+@receiver(post_delete, sender=JobCategory)
+def sync_memory_indexes_on_category_delete(sender, instance, **kwargs):
+    # its jobs are set to NULL with a bulk update, easier to rebuild
+    transaction.on_commit(autocomplete.invalidate)
+
+
+@receiver(post_save, sender=EmployerProfile)
+def sync_memory_indexes_on_employer_save(sender, instance, created, **kwargs):
+    if not business_name_changed(instance, created):
+        return
+
+    def sync():
+        autocomplete.renamed("company", instance.pk, instance.business_name)
+        fuzzy.company_renamed(instance.pk, instance.business_name)
+    transaction.on_commit(sync)
+
+
+# -------- Per-viewer saved/applied flags (Jobs/viewer.py) --------
+@receiver(post_save, sender=SaveJob)
+@receiver(post_delete, sender=SaveJob)
+def invalidate_viewer_flags_on_save_job(sender, instance, **kwargs):
+    profile_id = instance.profile_id
+    if profile_id:
+        transaction.on_commit(lambda: viewer.invalidate_profile(profile_id))
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_viewer_flags_on_application(sender, instance, **kwargs):
+    profile_id = instance.job_seeker_profile_id
+    if profile_id:
+        transaction.on_commit(lambda: viewer.invalidate_profile(profile_id))
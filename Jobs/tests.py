@@ -1,3 +1,229 @@
-from django.test import TestCase
+import json
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import skipUnless
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from JobSeeker.fieldsets import select_fields
+from JobSeeker.pagination import order_queryset
+from JobSeeker.text import fold_text, looks_like_zawgyi, normalize_text, segment_text, syllables, zawgyi_to_unicode
+from Jobs import cache as search_cache
+from Jobs.filters import parse_filters, filter_jobs
+from Jobs.listing import card_values, job_cards
+from Jobs.models import Jobs, JobCategory
+from Jobs.query import QueryError, apply_query, parse_query, search_ordering
+from Jobs.serializers import JobListSerializer
 
-# Create your tests here.
+
+@skipUnless(connection.vendor == "sqlite", "query plans are checked on SQLite")
+class JobFilterPlanTests(TestCase):
+    """
+    The first page of /job/jobs/filter/ for the common filter combinations,
+    and the featured-first /job/search/ order, is read from a partial
+    composite index with no sort step.
+    """
+    PAGE_SIZE = 20
+
+    # (filters, index the first page must be read from)
+    FILTER_CASES = [
+        ({}, "jobs_active_created_idx"),
+        ({"location": "SIT"}, "jobs_active_loc_created_idx"),
+        ({"location": "Sittwe", "salary_min": "100k", "priority": "URGENT"}, "jobs_active_loc_created_idx"),
+        ({"job_type": "FULL"}, "jobs_active_type_created_idx"),
+        ({"job_type": "FULL", "posted_within": "7"}, "jobs_active_type_created_idx"),
+        ({"category": str(uuid.uuid4())}, "jobs_category_created_idx"),
+    ]
+
+    # /job/search/ queries without text terms: featured first, then newest
+    SEARCH_CASES = [
+        ("", "jobs_active_rank_created_idx"),
+        ("salary>=300k", "jobs_active_rank_created_idx"),
+    ]
+
+    def assert_reads_index(self, queryset, index):
+        plan = queryset[:self.PAGE_SIZE + 1].explain()
+        self.assertIn(f"USING INDEX {index}", plan)
+        self.assertNotIn("TEMP B-TREE", plan, "the first page needs a sort")
+
+    def test_filter_plans(self):
+        for params, index in self.FILTER_CASES:
+            with self.subTest(filters=params):
+                self.assert_reads_index(order_queryset(filter_jobs(parse_filters(params))), index)
+
+    def test_search_plans(self):
+        for q, index in self.SEARCH_CASES:
+            with self.subTest(q=q):
+                parsed = parse_query(q)
+                queryset = apply_query(Jobs.objects.live(), parsed).order_by(*search_ordering(parsed))
+                self.assert_reads_index(queryset, index)
+
+
+class JobCardParityTests(TestCase):
+    """The values()-based cards (Jobs/listing.py) render exactly like JobListSerializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        employers = [
+            EmployerProfile.objects.create(
+                user=CustomUser.objects.create_user(email=f"cards{i}@example.com", role="employer"),
+                first_name="Card", last_name="Check", business_name=f"Cards Co {i}", city="Sittwe",
+                **({"logo": "upload_to_logo/cards.png"} if i else {}),
+            )
+            for i in range(2)
+        ]
+        category = JobCategory.objects.create(name="Cards")
+        locations = [code for code, label in Jobs.LOCATION_CHOICES]
+        priorities = [code for code, label in Jobs.PRIORITY_CHOICES]
+        for i in range(30):
+            Jobs.objects.create(
+                employer=employers[i % 2],
+                category=category if i % 7 else None,
+                title=f"Job {i}", description="<p>Card <b>check</b></p>" * 40,
+                location=locations[i % len(locations)],
+                priority=priorities[i % len(priorities)],
+                salary=100000 + i if i % 3 else None,
+                # past deadlines: still is_active in the row, rendered closed
+                deadline=date.today() - timedelta(days=1) if i % 11 == 0 else None,
+                is_active=bool(i % 5),
+            )
+
+    def render(self, data):
+        return json.loads(JSONRenderer().render(data))
+
+    def assert_parity(self, selection=None):
+        queryset = Jobs.objects.order_by("-created_at", "-id")
+        expected = JobListSerializer(
+            queryset.select_related("employer", "category"), many=True, selection=selection,
+        ).data
+        actual = job_cards(card_values(queryset, selection), selection=selection)
+        self.assertEqual(len(actual), 30)
+        self.assertEqual(self.render(actual), self.render(expected))
+
+    def test_cards_match_serializer(self):
+        self.assert_parity()
+
+    def test_cards_match_serializer_with_selection(self):
+        for fields in (["id", "title", "employer_business_name"], ["is_active", "priority_display", "category_name"]):
+            with self.subTest(fields=fields):
+                self.assert_parity(select_fields(JobListSerializer(), fields))
+
+
+class QueryParserTests(SimpleTestCase):
+    """parse_query() splits the search box text into its parts (Jobs/query.py)."""
+
+    def test_fields(self):
+        parsed = parse_query('title:driver loc:SIT type:FULL salary>=300k company:"Arakan Co" night shift')
+        self.assertEqual(parsed.words, ("night", "shift"))
+        self.assertEqual(parsed.text_fields, (("title", "driver", False), ("company", "Arakan Co", True)))
+        self.assertEqual(parsed.locations, ("SIT",))
+        self.assertEqual(parsed.job_types, ("FULL",))
+        self.assertEqual(parsed.salary, (("gte", Decimal("300000")),))
+        self.assertEqual(parsed.errors, ())
+
+    def test_values(self):
+        cases = [
+            ("salary:100k-2lakh", "salary", (("gte", Decimal("100000")), ("lte", Decimal("200000")))),
+            ("salary<3,000", "salary", (("lt", Decimal("3000")),)),
+            ("type:full-time,part", "job_types", ("FULL", "PART")),
+            ("priority:urgent", "priorities", ("URGENT",)),
+            ("loc:SIT,MD", "locations", ("SIT", "MD")),
+            ('"full time"', "phrases", ("full time",)),
+            ('company:"Arakan', "text_fields", (("company", "Arakan", True),)),
+            ("10:30 c++", "words", ("10:30", "c++")),  # not a field: plain text
+            ("title:", "text_fields", ()),
+        ]
+        for text, part, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(getattr(parse_query(text), part), expected)
+
+    def test_malformed(self):
+        parsed = parse_query("type:xyz salary>=abc priority:urgent")
+        self.assertEqual(parsed.errors, ("Unknown type: xyz", "Invalid salary: abc"))
+        self.assertEqual(parsed.priorities, ("URGENT",))
+        with self.assertRaisesMessage(QueryError, "Unknown type: xyz; Invalid salary: abc"):
+            apply_query(Jobs.objects.all(), parsed)
+
+    def test_parse_cache(self):
+        text = f"title:driver {uuid.uuid4().hex}"
+        misses = parse_query.cache_info().misses
+        first = parse_query(text)
+        self.assertIs(parse_query(text), first)
+        self.assertEqual(parse_query.cache_info().misses, misses + 1)
+
+
+class TextNormalizationTests(SimpleTestCase):
+    """JobSeeker/text.py: Zawgyi conversion, folding and syllable breaking."""
+
+    def test_zawgyi_to_unicode(self):
+        # "Myanmar" typed with a Zawgyi font: ya-yit and asat use other code points
+        zawgyi = "\u103b\u1019\u1014\u1039\u1019\u102c"
+        unicode = "\u1019\u103c\u1014\u103a\u1019\u102c"
+        self.assertTrue(looks_like_zawgyi(zawgyi))
+        self.assertFalse(looks_like_zawgyi(unicode))
+        self.assertEqual(zawgyi_to_unicode(zawgyi), unicode)
+        self.assertEqual(normalize_text(zawgyi), unicode)
+        # vowel e typed before its consonant
+        self.assertEqual(normalize_text("ေက်ာင္း"), "ကျောင်း")
+        self.assertEqual(normalize_text(unicode), unicode)
+
+    def test_fold_text(self):
+        self.assertEqual(fold_text("  Web   DEV "), "webdev")
+        self.assertEqual(fold_text("ေက်ာင္း  Arakan Co"), "ကျောင်းarakanco")
+        self.assertEqual(fold_text(None), "")
+
+    def test_syllables(self):
+        self.assertEqual(syllables("ကျောင်းဆရာ"), ["ကျောင်း", "ဆ", "ရာ"])
+        # stacked consonant (virama) stays in its syllable
+        self.assertEqual(syllables("ဗုဒ္ဓ"), ["ဗုဒ္ဓ"])
+        self.assertEqual(segment_text("ကျောင်းဆရာ Python"), "ကျောင်း ဆ ရာ Python")
+        self.assertEqual(syllables(""), [])
+
+
+class SearchCacheInvalidationTests(TestCase):
+    """Saving Jobs or JobCategory rows makes every cached search result unreachable."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(
+            user=CustomUser.objects.create_user(email="cache@example.com", role="employer"),
+            first_name="Cache", last_name="Check", business_name="Cache Co", city="Sittwe",
+        )
+        cls.category = JobCategory.objects.create(name="Caching")
+        cls.job = Jobs.objects.create(employer=cls.employer, category=cls.category, title="Cached", description="x")
+
+    def setUp(self):
+        self.computed = 0
+        self.params = {"q": f"Python  Dev {uuid.uuid4().hex}", "loc": "Sittwe"}
+
+    def search(self, params=None):
+        def compute():
+            self.computed += 1
+            return {"results": []}
+        return search_cache.get_or_compute("search", params or self.params, compute)
+
+    def test_normalized_params_share_an_entry(self):
+        self.search()
+        self.search({"q": f"  {self.params['q'].upper()} ", "loc": "SITTWE"})
+        self.assertEqual(self.computed, 1)
+
+    def test_saves_invalidate(self):
+        self.search()
+        for save in (self.job.save, self.category.save):
+            with self.subTest(save=save):
+                with self.captureOnCommitCallbacks(execute=True):
+                    save()
+                computed = self.computed
+                self.search()
+                self.search()
+                self.assertEqual(self.computed, computed + 1)
+
+    @override_settings(SHARED_CACHE_CHECK_SECONDS=0)
+    def test_bump_from_another_process(self):
+        self.search()
+        search_cache.shared_cache().set(search_cache.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        self.search()
+        self.assertEqual(self.computed, 2)
@@ -12,6 +12,7 @@ urlpatterns = [
     
     #jobs urls
     path('jobs/', views.jobs_list, name='jobs-list'),
+    path('jobs/filter/', views.jobs_filter, name='jobs-filter'),
     path('jobs/create/', views.jobs_create, name='job-create'),
     path('jobs/detail/<uuid:pk>/', views.jobs_detail, name='job-detail'),
     path('jobs/update/<uuid:pk>/', views.jobs_update, name='job-update'),
@@ -19,6 +20,9 @@ urlpatterns = [
 
     #search
     path('search/',views.search,name="search-list"),
+    path('search/cache-stats/',views.search_cache_stats,name="search-cache-stats"),
+    path('autocomplete/',views.autocomplete_suggestions,name="autocomplete"),
+    path('fuzzy/',views.fuzzy_lookup,name="fuzzy-lookup"),
 
     #quick search
     path('quick-search-city/',views.quick_search_by_location,name="quick-search"),
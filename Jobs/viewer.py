@@ -0,0 +1,74 @@
+# Jobs/viewer.py
+# Per-viewer flags on job cards and search results, for a logged-in seeker:
+#
+#   is_saved            the job is in their saved jobs
+#   is_applied          they applied to it
+#   application_status  status code of that application (None if not applied)
+#
+# The seeker's saved job ids and applied job id -> status are read with two
+# queries and cached per user in the "shared" cache (Jobs/cache.py, seen
+# by every process) for VIEWER_FLAGS_TIMEOUT seconds. Jobs/signals.py
+# drops the entry when one of their SaveJob / Application rows changes.
+# Shared (cached) search results stay viewer independent: the flags are
+# added per request.
+from django.conf import settings
+from .cache import shared_cache
+
+
+def _key(user_id):
+    return f"viewer-flags:{user_id}"
+
+
+def is_seeker(user):
+    return user.is_authenticated and getattr(user, "role", None) == "jobseeker"
+
+
+def job_flags(user):
+    """{"saved": {job id}, "applied": {job id: status}} (ids as str), None for non-seekers."""
+    if not is_seeker(user):
+        return None
+    flags = shared_cache().get(_key(user.pk))
+    if flags is None:
+        from Application.models import Application, SaveJob
+
+        saved = SaveJob.objects.filter(profile__user=user, job__isnull=False).values_list("job_id", flat=True)
+        applied = Application.objects.filter(job_seeker_profile__user=user).values_list("job_id", "status")
+        flags = {
+            "saved": {str(job_id) for job_id in saved},
+            "applied": {str(job_id): status for job_id, status in applied},
+        }
+        shared_cache().set(_key(user.pk), flags, getattr(settings, "VIEWER_FLAGS_TIMEOUT", 300))
+    return flags
+
+
+def add_flags(user, jobs):
+    """
+    Copies of the job dicts (cards or search rows) with the viewer flags
+    added. Returned unchanged for anyone but a seeker.
+    """
+    flags = job_flags(user)
+    if flags is None:
+        return jobs
+    flagged = []
+    for job in jobs:
+        job_id = str(job.get("id"))
+        flagged.append({
+            **job,
+            "is_saved": job_id in flags["saved"],
+            "is_applied": job_id in flags["applied"],
+            "application_status": flags["applied"].get(job_id),
+        })
+    return flagged
+
+
+def invalidate_users(user_ids):
+    shared_cache().delete_many([_key(user_id) for user_id in user_ids])
+
+
+def invalidate_profile(profile_id):
+    """Drop the cached flags of the seeker owning `profile_id`."""
+    from JobSeekerProfile.models import JobseekerProfile
+
+    user_id = JobseekerProfile.objects.filter(pk=profile_id).values_list("user_id", flat=True).first()
+    if user_id is not None:
+        invalidate_users([user_id])
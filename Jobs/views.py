@@ -2,21 +2,25 @@
 from django.shortcuts import render
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import BasePermission,IsAuthenticated,AllowAny
+from rest_framework.permissions import BasePermission,IsAuthenticated,AllowAny,IsAdminUser
 from rest_framework.response import Response
-from django.utils import timezone
-from django.db.models import Q,F, Case, When, Value, IntegerField
+from django.db.models import F
 from django.db.models import Count
-from datetime import date
 from django.db import IntegrityError
-from django.db.models import (
-    Q, F, Value, Func, Case, When, IntegerField, CharField
-)
 
 # import Application
 from Application.models import Application
 from .models import JobCategory, Jobs
-from .serializers import JobCategorySerializer, JobsSerializer
+from .serializers import JobCategorySerializer, JobsSerializer, JobListSerializer
+from .query import parse_query, apply_query, build_match, search_ordering
+from .search import search_index_available, count_hits
+from .filters import parse_filters, filter_jobs
+from .listing import card_values, job_cards
+from JobSeeker.fieldsets import requested_fields
+from . import cache as search_cache
+from .facets import facet_counts
+from . import autocomplete, fuzzy, viewer
+from JobSeeker.pagination import paginate, default_page_size
 from EmployerProfile.models import EmployerProfile
 from django.shortcuts import get_object_or_404
 
@@ -111,20 +115,37 @@ def job_category_delete(request, pk):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def jobs_list(request):
-    today = date.today()
     user = request.user
-    Jobs.objects.filter(is_active=True, deadline__lt=today).update(is_active=False)
+    # expired jobs are closed by the close_expired_jobs command, not here
     if user.is_staff:  
         # Admin → All jobs
-        jobs = Jobs.objects.all().order_by('-created_at')
+        jobs = Jobs.objects.all()
     elif hasattr(user, "employerprofile"):
         # Employer → Only their own jobs
-        jobs = Jobs.objects.filter(employer__user=user).order_by('-created_at')
+        jobs = Jobs.objects.filter(employer__user=user)
     else:  
-        jobs = Jobs.objects.filter(is_active=True).order_by('-created_at')
-    serializer = JobsSerializer(jobs, many=True)
+        jobs = Jobs.objects.live()
+    # ?fields= / ?omit= (JobSeeker/fieldsets.py)
+    selection = requested_fields(request, JobListSerializer)
+    jobs, next_cursor = paginate(request, card_values(jobs, selection), ("-created_at", "-id"))
     return Response({
-        "jobs":serializer.data,
+        # is_saved / is_applied / application_status for a seeker (Jobs/viewer.py)
+        "jobs": viewer.add_flags(user, job_cards(jobs, selection=selection)),
+        "next_cursor": next_cursor,
+    }, status=status.HTTP_200_OK)
+
+# jobs filter
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def jobs_filter(request):
+    # location, job_type, category, employer, salary_min/max, posted_within, priority
+    filters = parse_filters(request.GET)
+    jobs = filter_jobs(filters)
+    selection = requested_fields(request, JobListSerializer)
+    jobs, next_cursor = paginate(request, card_values(jobs, selection), ("-created_at", "-id"), page_size=default_page_size())
+    return Response({
+        "jobs": viewer.add_flags(request.user, job_cards(jobs, selection=selection)),
+        "next_cursor": next_cursor,
     }, status=status.HTTP_200_OK)
 
 # jobs create
@@ -185,7 +206,7 @@ def jobs_update(request, pk):
     # ------------------------------------------
     # 🔥 AUTO REACTIVATE JOB IF MAX APPLICANTS INCREASED
     # ------------------------------------------
-    total_apps = updated_job.applications.count()
+    total_apps = updated_job.applications_count
 
     # If the new max is higher AND job is inactive → reactivate
     if updated_job.max_applicants and total_apps < updated_job.max_applicants:
@@ -209,103 +230,185 @@ def jobs_delete(request, pk):
     return Response({'message': 'Job deleted'}, status=status.HTTP_204_NO_CONTENT)
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def search(request):
-    q = (request.GET.get("q") or "").strip()
-    loc = (request.GET.get("loc") or "").strip()
-    today = date.today()
+def _viewer_role(user):
+    if user.is_staff:
+        return "staff"
+    return getattr(user, "role", "anonymous")
 
-    # Not expired filter
-    not_expired = Q(deadline__isnull=True) | Q(deadline__gte=today)
 
-    # Base queryset
-    qs = Jobs.objects.filter(is_active=True).filter(not_expired)
+def _search_queryset(parsed, loc):
+    # Base queryset (active + not expired)
+    qs = Jobs.objects.live()
 
     # Ensure employer is joined
     qs = qs.select_related("employer")
 
-    normalized_q = q.replace(" ", "")
-    normalized_loc = loc.replace(" ", "")
-
-    # Annotate everything we need
     qs = qs.annotate(
-        title_nospace=Func(F("title"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        location_nospace=Func(F("location"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
         category_name=F("category__name"),
-        category_name_nospace=Func(F("category__name"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        description_nospace=Func(F("description"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
 
         # ✔️ Annotated employer business name
         employer_business_name=F("employer__business_name"),
     )
 
-    if q:
-        qs = qs.filter(
-            Q(title__icontains=q) |
-            Q(location__icontains=q) |
-            Q(category__name__icontains=q) |
-            Q(description__icontains=q) |
-            Q(title_nospace__icontains=normalized_q) |
-            Q(location_nospace__icontains=normalized_q) |
-            Q(category_name_nospace__icontains=normalized_q) |
-            Q(description_nospace__icontains=normalized_q)
-        )
+    # Field filters + full-text match (Jobs/query.py, FTS5 index)
+    qs = apply_query(qs, parsed)
+    ordering = search_ordering(parsed)
 
     if loc:
-        qs = qs.filter(
-            Q(location__icontains=loc) |
-            Q(location_nospace__icontains=normalized_loc)
-        )
+        # exact label/code first, then "Sitwe" / "Maung Daw" through the
+        # trigram index (same as location: in the query language)
+        codes = Jobs.objects.location_codes(loc) or fuzzy.resolve_townships(loc)
+        if codes:
+            qs = qs.filter(location__in=codes)
+        else:
+            qs = qs.filter(location__icontains=loc)
+    return qs, ordering
 
-    qs = qs.annotate(
-        priority_rank=Case(
-            When(priority="FEATURED", then=Value(3)),
-            When(priority="URGENT", then=Value(2)),
-            default=Value(1),
-            output_field=IntegerField(),
-        )
-    ).order_by("-priority_rank", "-created_at")
+
+def _search_results(parsed, loc, facets=False):
+    qs, ordering = _search_queryset(parsed, loc)
+    result = {}
+
+    # exact when cheap, estimated (count_exact=False) for large full-text hits
+    match = build_match(parsed) if search_index_available() else None
+    result["count"], result["count_exact"] = count_hits(qs, match)
+
+    if facets:
+        # counted over the same filters as the results, in one grouped query
+        result["facets"] = facet_counts(qs)
+
+    # priority_rank is a stored, indexed column (featured first)
+    qs = qs.order_by(*ordering)
 
     # 🚨 FIXED: Use employer_business_name not employer__business_name
-    data = list(
+    result["results"] = list(
         qs.values(
             "id",
             "title",
             "location",
             "category_name",
             "employer_business_name",  # ← THE KEY FIX
-            "description",
+            "description_excerpt",  # full description only on jobs_detail
             "deadline",
             "created_at",
             "priority"
         )[:30]
     )
+    return result
 
-    return Response({
-        "count": len(data),
-        "results": data
-    }, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search(request):
+    q = " ".join((request.GET.get("q") or "").split())
+    loc = " ".join((request.GET.get("loc") or "").split())
+
+    facets = request.GET.get("facets") in ("1", "true")
+
+    # title:driver loc:SIT salary>=300000 "exact phrase" ... (Jobs/query.py)
+    parsed = parse_query(q)
+    if parsed.errors:
+        return Response({"error": "; ".join(parsed.errors)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # same normalized (q, loc, facets, role) -> served from the search cache
+    data = search_cache.get_or_compute(
+        "search",
+        {"q": q, "loc": loc, "facets": facets, "role": _viewer_role(request.user)},
+        lambda: _search_results(parsed, loc, facets),
+    )
+
+    response = {
+        "count": data["count"],
+        "count_exact": data["count_exact"],
+        # cached results are shared per role, the viewer flags are added per request
+        "results": viewer.add_flags(request.user, data["results"])
+    }
+    if facets:
+        response["facets"] = data["facets"]
+    return Response(response, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def autocomplete_suggestions(request):
+    q = request.GET.get("q") or ""
+    try:
+        limit = int(request.GET.get("limit") or 0) or None
+    except ValueError:
+        return Response({"error": "limit must be a number"}, status=status.HTTP_400_BAD_REQUEST)
+
+    suggestions = autocomplete.suggest(q, limit) if q.strip() else []
+    return Response({"q": q, "suggestions": suggestions}, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def fuzzy_lookup(request):
+    q = request.GET.get("q") or ""
+    kinds = [kind for kind in (request.GET.get("type") or "").split(",") if kind]
+    if any(kind not in fuzzy.KINDS for kind in kinds):
+        return Response({"error": f"type must be one of {', '.join(fuzzy.KINDS)}"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        threshold = float(request.GET["threshold"]) if request.GET.get("threshold") else None
+        limit = int(request.GET.get("limit") or 10)
+    except ValueError:
+        return Response({"error": "threshold and limit must be numbers"}, status=status.HTTP_400_BAD_REQUEST)
+    if threshold is not None and not 0 <= threshold <= 1:
+        return Response({"error": "threshold must be between 0 and 1"}, status=status.HTTP_400_BAD_REQUEST)
+
+    matches = fuzzy.lookup(q, kinds or None, threshold, max(1, min(limit, 50)))
+    return Response({"q": q, "matches": matches}, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def search_cache_stats(request):
+    return Response(search_cache.stats(), status=status.HTTP_200_OK)
 
 
 
 #quck search 
+def _quick_search_params(request, term):
+    return {
+        "term": term,
+        "cursor": request.GET.get("cursor"),
+        "page_size": request.GET.get("page_size"),
+        "fields": request.GET.get("fields"),
+        "omit": request.GET.get("omit"),
+        "role": _viewer_role(request.user),
+    }
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def quick_search_by_location(request):
    location=request.GET.get("city_name")
-   jobs=Jobs.objects.quick_search_by_city(location)
-   serializer=JobsSerializer(jobs,many=True)
-   return Response({"jobs":serializer.data},status=status.HTTP_200_OK)
+   selection=requested_fields(request,JobListSerializer)
+
+   def results():
+      jobs=Jobs.objects.quick_search_by_city(location)
+      jobs,next_cursor=paginate(request,card_values(jobs,selection),("-created_at","-id"))
+      return {"jobs":job_cards(jobs,selection=selection),"next_cursor":next_cursor}
+
+   data=search_cache.get_or_compute("quick-city",_quick_search_params(request,location),results)
+   data={**data,"jobs":viewer.add_flags(request.user,data["jobs"])}
+   return Response(data,status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def quick_search_by_category(request):
    category=request.GET.get("category")
-   jobs=Jobs.objects.quick_search_by_category(category)
-   serializer=JobsSerializer(jobs,many=True)
-   return Response({"jobs":serializer.data},status=status.HTTP_200_OK)
+   selection=requested_fields(request,JobListSerializer)
+
+   def results():
+      jobs=Jobs.objects.quick_search_by_category(category)
+      jobs,next_cursor=paginate(request,card_values(jobs,selection),("-created_at","-id"))
+      return {"jobs":job_cards(jobs,selection=selection),"next_cursor":next_cursor}
+
+   data=search_cache.get_or_compute("quick-category",_quick_search_params(request,category),results)
+   data={**data,"jobs":viewer.add_flags(request.user,data["jobs"])}
+   return Response(data,status=status.HTTP_200_OK)
         
 
 
@@ -8,6 +8,7 @@ from .models import Notification
 from Application.models import *
 from Jobs.models import *
 from .serializers import NotificationSerializer
+from JobSeeker.pagination import paginate
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 
@@ -180,6 +181,10 @@ def job_notifications_list(request):
     qs = (Notification.objects
           .filter(content_type=ct_jobs)
         #   .select_related('content_type')
-          .order_by('-created_at'))
+          )
+    qs, next_cursor = paginate(request, qs, ("-created_at", "-id"))
     serializer = NotificationSerializer(qs, many=True)
-    return Response(serializer.data)
+    return Response({
+        "notifications": serializer.data,
+        "next_cursor": next_cursor,
+    })
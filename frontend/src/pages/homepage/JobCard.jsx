@@ -92,17 +92,15 @@ export default function JobCard({ job }) {
           <span>${job.salary || "Negotiable"}</span>
         </li>
 
-        {/* Short Description */}
+        {/* Short Description (plain-text excerpt from the list API) */}
         <li className="pt-1">
-          <span
-            dangerouslySetInnerHTML={{
-              __html: job.description
-                ? job.description.length > 35
-                  ? job.description.slice(0, 35) + "..."
-                  : job.description
-                : "No description available.",
-            }}
-          ></span>
+          <span>
+            {job.description_excerpt
+              ? job.description_excerpt.length > 35
+                ? job.description_excerpt.slice(0, 35) + "..."
+                : job.description_excerpt
+              : "No description available."}
+          </span>
         </li>
       </ul>
 
@@ -45,16 +45,12 @@ const JobCard = ({ job }) => {
       <p className="text-sm text-gray-500 mt-1">
         {getLocationLabel(job.location)}
       </p>
-      {/* Job Description (truncated, rendered as HTML) */}
-      <div
-        className="text-sm text-gray-700 mt-3"
-        dangerouslySetInnerHTML={{
-          __html:
-            job.description?.length > 30
-              ? job.description.slice(0, 30) + "..."
-              : job.description || "No description available",
-        }}
-      ></div>
+      {/* Job Description (plain-text excerpt from the list API, truncated) */}
+      <div className="text-sm text-gray-700 mt-3">
+        {job.description_excerpt?.length > 30
+          ? job.description_excerpt.slice(0, 30) + "..."
+          : job.description_excerpt || "No description available"}
+      </div>
       {/* Footer: Deadline & Save Button */}
       <div className="flex items-center justify-between mt-4">
         <p className="text-sm text-gray-400">